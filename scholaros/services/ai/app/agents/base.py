@@ -86,6 +86,19 @@ class BaseAgent(ABC):
     max_tokens: int = 4000
     model: str | None = None
 
+    # Prompt prefix used when context is injected, built once per class from
+    # _context_prompt_source (the class's system_prompt at creation)
+    _context_prompt_prefix: str = ""
+    _context_prompt_source: str | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the fixed parts of the system prompt at class creation."""
+        super().__init_subclass__(**kwargs)
+        system_prompt = getattr(cls, "system_prompt", None)
+        if isinstance(system_prompt, str):
+            cls._context_prompt_prefix = f"{system_prompt}\n\n## Context\n"
+            cls._context_prompt_source = system_prompt
+
     def __init__(self, llm_service: LLMService | None = None):
         """Initialize the agent."""
         self.llm = llm_service or get_llm_service()
@@ -183,6 +196,8 @@ class BaseAgent(ABC):
             context_info.append(f"Current Goal: {context.working_memory.current_goal}")
 
         if context_info:
+            if system_prompt is self._context_prompt_source:
+                return self._context_prompt_prefix + "\n".join(context_info)
             return f"{system_prompt}\n\n## Context\n" + "\n".join(context_info)
 
         return system_prompt
@@ -1,7 +1,9 @@
 """Agent Orchestrator for coordinating multi-agent workflows."""
 
 import asyncio
+import json
 import logging
+import re
 import uuid
 from datetime import datetime
 from typing import Any
@@ -29,6 +31,13 @@ from app.agents.types import (
 
 logger = logging.getLogger(__name__)
 
+# Most workflow steps an orchestration runs at once
+MAX_PARALLEL_STEPS = 4
+
+# Step input templates that read other steps' results (see _resolve_references)
+_STEP_REFERENCE = re.compile(r"\{\{\s*steps\.([^.}\s]+)")
+_PREV_REFERENCE = re.compile(r"\{\{\s*prev\.")
+
 
 class AgentOrchestrator:
     """
@@ -253,58 +262,27 @@ class AgentOrchestrator:
         self._active_workflows[execution_id] = execution
 
         try:
-            # Build dependency graph
-            step_order = self._topological_sort(workflow.steps)
-
-            # Execute steps in order
-            for step_id in step_order:
-                step = next(s for s in workflow.steps if s.id == step_id)
-                execution.current_step = step_id
-
-                # Check dependencies
-                if not self._dependencies_satisfied(step, execution):
-                    if workflow.error_handling == "fail_fast":
-                        raise RuntimeError(f"Dependencies not satisfied for step: {step_id}")
-                    continue
-
-                # Check condition
-                if step.condition and not self._evaluate_condition(step.condition, execution, request.input):
-                    execution.step_results[step_id] = WorkflowStepResult(
-                        step_id=step_id,
-                        status="skipped",
-                        agent_type=step.agent
-                    )
-                    continue
-
-                # Execute step
-                step_result = await self._execute_workflow_step(
-                    step,
-                    execution,
-                    context,
-                    request.input
-                )
-                execution.step_results[step_id] = step_result
-
-                # Handle step failure
-                if step_result.status == "failed":
-                    if step.on_error == "fail":
-                        raise RuntimeError(f"Step failed: {step_id} - {step_result.error}")
-                    elif step.on_error == "fallback" and step.fallback_agent:
-                        # Retry with fallback agent
-                        fallback_step = WorkflowStep(
-                            id=f"{step_id}_fallback",
-                            name=f"{step.name} (fallback)",
-                            agent=step.fallback_agent,
-                            action=step.action,
-                            input=step.input
+            # Steps in the same wave have no dependencies on each other
+            semaphore = asyncio.Semaphore(MAX_PARALLEL_STEPS)
+            for wave in self._execution_waves(workflow.steps):
+                outcomes = await asyncio.gather(
+                    *(
+                        self._run_workflow_step(
+                            step, workflow, execution, context, request.input, semaphore
                         )
-                        fallback_result = await self._execute_workflow_step(
-                            fallback_step,
-                            execution,
-                            context,
-                            request.input
-                        )
-                        execution.step_results[step_id] = fallback_result
+                        for step in wave
+                    ),
+                    return_exceptions=True,
+                )
+                # Keep results in definition order however the wave finished
+                for step in wave:
+                    if step.id in execution.step_results:
+                        execution.step_results[step.id] = execution.step_results.pop(step.id)
+
+                # Let the whole wave finish, then fail on the first error in step order
+                for outcome in outcomes:
+                    if isinstance(outcome, BaseException):
+                        raise outcome
 
             # Mark completed
             execution.status = "completed"
@@ -333,6 +311,68 @@ class AgentOrchestrator:
             # Clean up
             del self._active_workflows[execution_id]
 
+    async def _run_workflow_step(
+        self,
+        step: WorkflowStep,
+        workflow: WorkflowDefinition,
+        execution: WorkflowExecution,
+        context: AgentContext,
+        workflow_input: dict[str, Any],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Run one step of a workflow, recording its result on the execution."""
+        step_id = step.id
+
+        # Check dependencies
+        if not self._dependencies_satisfied(step, execution):
+            if workflow.error_handling == "fail_fast":
+                raise RuntimeError(f"Dependencies not satisfied for step: {step_id}")
+            return
+
+        # Check condition
+        if step.condition and not self._evaluate_condition(
+            step.condition, execution, workflow_input
+        ):
+            execution.step_results[step_id] = WorkflowStepResult(
+                step_id=step_id,
+                status="skipped",
+                agent_type=step.agent
+            )
+            return
+
+        async with semaphore:
+            execution.current_step = step_id
+
+            # Execute step
+            step_result = await self._execute_workflow_step(
+                step,
+                execution,
+                context,
+                workflow_input
+            )
+            execution.step_results[step_id] = step_result
+
+            # Handle step failure
+            if step_result.status == "failed":
+                if step.on_error == "fail":
+                    raise RuntimeError(f"Step failed: {step_id} - {step_result.error}")
+                elif step.on_error == "fallback" and step.fallback_agent:
+                    # Retry with fallback agent
+                    fallback_step = WorkflowStep(
+                        id=f"{step_id}_fallback",
+                        name=f"{step.name} (fallback)",
+                        agent=step.fallback_agent,
+                        action=step.action,
+                        input=step.input
+                    )
+                    fallback_result = await self._execute_workflow_step(
+                        fallback_step,
+                        execution,
+                        context,
+                        workflow_input
+                    )
+                    execution.step_results[step_id] = fallback_result
+
     async def _execute_workflow_step(
         self,
         step: WorkflowStep,
@@ -412,30 +452,69 @@ class AgentOrchestrator:
                 agent_type=step.agent
             )
 
-    def _topological_sort(self, steps: list[WorkflowStep]) -> list[str]:
-        """Sort workflow steps by dependencies."""
-        # Build adjacency list
-        graph: dict[str, list[str]] = {s.id: s.depends_on for s in steps}
-        in_degree: dict[str, int] = {s.id: len(s.depends_on) for s in steps}
-
-        # Find steps with no dependencies
-        queue = [sid for sid, degree in in_degree.items() if degree == 0]
-        result = []
-
-        while queue:
-            current = queue.pop(0)
-            result.append(current)
-
-            for step_id, deps in graph.items():
-                if current in deps:
+    def _execution_waves(self, steps: list[WorkflowStep]) -> list[list[WorkflowStep]]:
+        """
+        Group workflow steps into waves that can run concurrently.
+
+        Each wave holds the steps whose dependencies are all in earlier
+        waves, in definition order. Besides depends_on, a step waits for the
+        steps its input templates or condition read through "steps.<id>",
+        provided they ran before it when steps ran one at a time. "prev."
+        means whichever step finished last, so workflows using it still run
+        one step at a time.
+        """
+        waves = self._dependency_waves(steps, {s.id: list(s.depends_on) for s in steps})
+        order = [step for wave in waves for step in wave]
+        if any(_PREV_REFERENCE.search(json.dumps(s.input, default=str)) for s in steps):
+            return [[step] for step in order]
+
+        position = {step.id: i for i, step in enumerate(order)}
+        dependencies = {}
+        for step in steps:
+            referenced = set(_STEP_REFERENCE.findall(json.dumps(step.input, default=str)))
+            if step.condition and (step.condition.expression or "").startswith("steps."):
+                referenced.add(step.condition.expression.split(".")[1])
+            dependencies[step.id] = list(step.depends_on) + [
+                step_id
+                for step_id in referenced
+                if step_id not in step.depends_on
+                and position.get(step_id, len(order)) < position[step.id]
+            ]
+        return self._dependency_waves(steps, dependencies)
+
+    def _dependency_waves(
+        self,
+        steps: list[WorkflowStep],
+        dependencies: dict[str, list[str]],
+    ) -> list[list[WorkflowStep]]:
+        """Level steps by the given dependencies (Kahn's algorithm)."""
+        in_degree: dict[str, int] = {s.id: len(dependencies[s.id]) for s in steps}
+        dependents: dict[str, list[str]] = {s.id: [] for s in steps}
+        for s in steps:
+            for dep_id in dependencies[s.id]:
+                if dep_id in dependents:
+                    dependents[dep_id].append(s.id)
+
+        by_id = {s.id: s for s in steps}
+        wave = [s for s in steps if in_degree[s.id] == 0]
+        waves = []
+        scheduled = 0
+
+        while wave:
+            waves.append(wave)
+            scheduled += len(wave)
+            ready = set()
+            for step in wave:
+                for step_id in dependents[step.id]:
                     in_degree[step_id] -= 1
                     if in_degree[step_id] == 0:
-                        queue.append(step_id)
+                        ready.add(step_id)
+            wave = [by_id[step_id] for step_id in by_id if step_id in ready]
 
-        if len(result) != len(steps):
+        if scheduled != len(steps):
             raise ValueError("Circular dependency detected in workflow steps")
 
-        return result
+        return waves
 
     def _dependencies_satisfied(
         self,
@@ -491,8 +570,6 @@ class AgentOrchestrator:
         - {{steps.step_id.output.key}} - Reference previous step output
         - {{prev.key}} - Reference previous step output (shorthand)
         """
-        import re
-
         def resolve_value(value: Any) -> Any:
             if isinstance(value, str):
                 # Check for template pattern
@@ -24,6 +24,9 @@ class AgentRegistry:
     def __init__(self):
         self._agents: dict[AgentType, "BaseAgent"] = {}
         self._initialized = False
+        # Agent metadata is static per instance; rebuilt only when agents change
+        self._info_cache: list[dict] | None = None
+        self._details_cache: dict[AgentType, dict] = {}
 
     def register(self, agent: "BaseAgent") -> None:
         """Register an agent instance."""
@@ -31,12 +34,14 @@ class AgentRegistry:
             logger.warning(f"Replacing existing agent: {agent.agent_type.value}")
 
         self._agents[agent.agent_type] = agent
+        self._clear_info_cache()
         logger.info(f"Registered agent: {agent.agent_type.value} ({agent.name})")
 
     def unregister(self, agent_type: AgentType) -> None:
         """Unregister an agent."""
         if agent_type in self._agents:
             del self._agents[agent_type]
+            self._clear_info_cache()
             logger.info(f"Unregistered agent: {agent_type.value}")
 
     def get(self, agent_type: AgentType) -> "BaseAgent | None":
@@ -117,17 +122,54 @@ class AgentRegistry:
         logger.info(f"Initialized {len(agents)} agents")
 
     def get_agent_info(self) -> list[dict]:
-        """Get information about all registered agents."""
-        return [
-            {
+        """
+        Get information about all registered agents.
+
+        The list is cached until agents change; treat it as read-only.
+        """
+        if self._info_cache is None:
+            self._info_cache = [
+                {
+                    "type": agent.agent_type.value,
+                    "name": agent.name,
+                    "description": agent.description,
+                    "capabilities": [cap.name for cap in agent.capabilities],
+                    "tools": [tool.name for tool in agent.tools],
+                }
+                for agent in self._agents.values()
+            ]
+        return self._info_cache
+
+    def get_agent_details(self, agent_type: AgentType) -> dict | None:
+        """
+        Get an agent's capabilities and tools with their descriptions.
+
+        Cached per agent type until agents change; treat it as read-only.
+        """
+        details = self._details_cache.get(agent_type)
+        if details is None:
+            agent = self._agents.get(agent_type)
+            if agent is None:
+                return None
+            details = self._details_cache[agent_type] = {
                 "type": agent.agent_type.value,
                 "name": agent.name,
                 "description": agent.description,
-                "capabilities": [cap.name for cap in agent.capabilities],
-                "tools": [tool.name for tool in agent.tools],
+                "capabilities": [
+                    {"name": cap.name, "description": cap.description}
+                    for cap in agent.capabilities
+                ],
+                "tools": [
+                    {"name": tool.name, "description": tool.description}
+                    for tool in agent.tools
+                ],
             }
-            for agent in self._agents.values()
-        ]
+        return details
+
+    def _clear_info_cache(self) -> None:
+        """Drop cached agent metadata after the set of agents changes."""
+        self._info_cache = None
+        self._details_cache.clear()
 
 
 # Global registry instance
@@ -16,14 +16,17 @@ from .onboarding import (
 from .validation import (
     FeatureValidator,
     ValidationResult,
+    ValidationResults,
     MetricDefinition,
     StatisticalTest,
+    RunningStats,
 )
 from .ab_testing import (
     ABTestAnalyzer,
     ExperimentConfig,
     ExperimentResult,
     VariantMetrics,
+    VariantSummary,
 )
 
 __all__ = [
@@ -35,11 +38,14 @@ __all__ = [
     # Validation
     "FeatureValidator",
     "ValidationResult",
+    "ValidationResults",
     "MetricDefinition",
     "StatisticalTest",
+    "RunningStats",
     # A/B Testing
     "ABTestAnalyzer",
     "ExperimentConfig",
     "ExperimentResult",
     "VariantMetrics",
+    "VariantSummary",
 ]
@@ -12,10 +12,14 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Callable, Tuple
 from enum import Enum
+from itertools import accumulate
+import bisect
+import functools
 import math
 import hashlib
-import statistics
-import random
+
+import numpy as np
+from scipy import special
 
 
 class ExperimentStatus(Enum):
@@ -28,6 +32,12 @@ class ExperimentStatus(Enum):
     ROLLED_BACK = "rolled_back"
 
 
+class HashAlgorithm(Enum):
+    """Hash used for deterministic bucketing."""
+    MD5 = "md5"  # Original scheme; keeps existing user-to-variant mappings
+    BLAKE2B = "blake2b"  # Faster 64-bit digest for new experiments
+
+
 class AssignmentStrategy(Enum):
     """How users are assigned to variants."""
     RANDOM = "random"
@@ -35,7 +45,7 @@ class AssignmentStrategy(Enum):
     STRATIFIED = "stratified"  # Balanced across segments
 
 
-@dataclass
+@dataclass(slots=True)
 class Variant:
     """A variant in an A/B test."""
     name: str
@@ -45,7 +55,7 @@ class Variant:
     config: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperimentConfig:
     """Configuration for an A/B experiment."""
     experiment_id: str
@@ -64,6 +74,20 @@ class ExperimentConfig:
     targeting_rules: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
     status: ExperimentStatus = ExperimentStatus.DRAFT
+    # Assignment lookup tables, derived from variants in __post_init__
+    _cumulative_weights: Tuple[float, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    _variant_names: Tuple[str, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    # Targeting rules split into equality and membership checks
+    _eq_rules: Dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _set_rules: Dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         # Validate weights sum to 1
@@ -76,8 +100,53 @@ class ExperimentConfig:
         if len(controls) != 1:
             raise ValueError("Exactly one variant must be marked as control")
 
+        self._cumulative_weights = tuple(accumulate(v.weight for v in self.variants))
+        self._variant_names = tuple(v.name for v in self.variants)
+        self.compile_targeting_rules()
+
+    def compile_targeting_rules(self) -> None:
+        """
+        Precompute targeting matchers from targeting_rules.
+
+        List-valued rules become frozensets for O(1) membership (tuples if
+        any allowed value is unhashable). Call again after editing the rules.
+        """
+        self._eq_rules = {}
+        self._set_rules = {}
+        for key, expected in self.targeting_rules.items():
+            if isinstance(expected, list):
+                try:
+                    self._set_rules[key] = frozenset(expected)
+                except TypeError:
+                    self._set_rules[key] = tuple(expected)
+            else:
+                self._eq_rules[key] = expected
+
+    def variant_for_bucket(self, bucket: float) -> str:
+        """Return the variant whose cumulative weight range contains bucket."""
+        index = bisect.bisect_right(self._cumulative_weights, bucket)
+        return self._variant_names[min(index, len(self._variant_names) - 1)]
+
+
+def _mean_and_m2(arr: np.ndarray) -> Tuple[float, float]:
+    """
+    Return the mean and sum of squared deviations of a non-empty array.
+
+    Uses the fused sum / sum-of-squares form, which reads the data without
+    materializing a centered copy. When the variance is tiny next to the
+    mean, that form cancels badly, so those cases are recomputed centered.
+    """
+    total = float(arr.sum())
+    sum_sq = float(arr @ arr)
+    mean = total / arr.size
+    m2 = sum_sq - total * mean
+    if m2 <= sum_sq * 1e-8:
+        centered = arr - mean
+        m2 = float(centered @ centered)
+    return mean, m2
+
 
-@dataclass
+@dataclass(slots=True)
 class VariantMetrics:
     """Metrics for a single variant."""
     variant_name: str
@@ -87,26 +156,110 @@ class VariantMetrics:
     mean_value: float = 0.0
     std_value: float = 0.0
     confidence_interval: Tuple[float, float] = (0.0, 0.0)
-    values: List[float] = field(default_factory=list)
+    # Raw observations as a dense float64 array (lists are converted);
+    # excluded from repr so logged metrics stay small
+    values: np.ndarray = field(
+        default_factory=lambda: np.empty(0, dtype=np.float64),
+        repr=False,
+        compare=False,
+    )
+    # Running state for streaming updates: count, mean, sum of squared
+    # deviations (M2) and number of positive observations
+    _n: int = field(default=0, init=False, repr=False, compare=False)
+    _mean: float = field(default=0.0, init=False, repr=False, compare=False)
+    _m2: float = field(default=0.0, init=False, repr=False, compare=False)
+    _pos_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.values = np.asarray(self.values, dtype=np.float64)
 
     def compute_stats(self) -> None:
-        """Compute statistics from raw values."""
-        if self.values:
-            self.sample_size = len(self.values)
-            self.mean_value = statistics.mean(self.values)
-            if len(self.values) > 1:
-                self.std_value = statistics.stdev(self.values)
+        """
+        Compute statistics from raw values.
+
+        Also seeds the running state, so update()/update_batch() can extend
+        the statistics afterwards without rescanning values.
+        """
+        if self.values.size:
+            arr = self.values
+            self._n = int(arr.size)
+            self._mean, self._m2 = _mean_and_m2(arr)
             # For binary metrics
-            self.conversions = sum(1 for v in self.values if v > 0)
-            self.conversion_rate = self.conversions / self.sample_size if self.sample_size > 0 else 0
+            self._pos_count = int(np.count_nonzero(arr > 0))
+            self._sync_running_stats()
+
+    def update(self, x: float) -> None:
+        """Add one observation to the running statistics (Welford's method)."""
+        self._n += 1
+        delta = x - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (x - self._mean)
+        if x > 0:
+            self._pos_count += 1
+        self._sync_running_stats()
+
+    def update_batch(self, new_values: Any) -> None:
+        """
+        Merge a batch of observations into the running statistics.
+
+        The batch is reduced on its own and combined with the existing state
+        using Chan et al.'s parallel formula, so cost is O(len(new_values)).
+        """
+        arr = np.asarray(new_values, dtype=np.float64)
+        if not arr.size:
+            return
+
+        batch_n = int(arr.size)
+        batch_mean, batch_m2 = _mean_and_m2(arr)
+
+        total_n = self._n + batch_n
+        delta = batch_mean - self._mean
+        self._mean += delta * batch_n / total_n
+        self._m2 += batch_m2 + delta * delta * self._n * batch_n / total_n
+        self._n = total_n
+        self._pos_count += int(np.count_nonzero(arr > 0))
+        self._sync_running_stats()
+
+    def _sync_running_stats(self) -> None:
+        """Publish the running state to the public statistic fields."""
+        self.sample_size = self._n
+        self.mean_value = self._mean
+        if self._n > 1:
+            self.std_value = math.sqrt(self._m2 / (self._n - 1))
+        self.conversions = self._pos_count
+        self.conversion_rate = self._pos_count / self._n
+
+    def to_summary(self) -> "VariantSummary":
+        """Return the computed statistics without the raw observations."""
+        return VariantSummary(
+            variant_name=self.variant_name,
+            sample_size=self.sample_size,
+            conversions=self.conversions,
+            conversion_rate=self.conversion_rate,
+            mean_value=self.mean_value,
+            std_value=self.std_value,
+            confidence_interval=self.confidence_interval,
+        )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class VariantSummary:
+    """Summary statistics for a single variant, without raw values."""
+    variant_name: str
+    sample_size: int
+    conversions: int
+    conversion_rate: float
+    mean_value: float
+    std_value: float
+    confidence_interval: Tuple[float, float]
+
+
+@dataclass(slots=True)
 class ExperimentResult:
     """Results of an A/B experiment."""
     experiment_id: str
     analysis_date: datetime
-    variant_metrics: Dict[str, VariantMetrics]
+    variant_metrics: Dict[str, VariantSummary]
     control_name: str
     winner: Optional[str]
     relative_lift: float  # Best treatment vs control
@@ -119,6 +272,139 @@ class ExperimentResult:
     can_conclude: bool
     recommendation: str
     raw_results: Dict[str, Any] = field(default_factory=dict)
+    # Bootstrap CI for relative_lift; None unless requested in analyze()
+    confidence_interval: Optional[Tuple[float, float]] = None
+
+
+_SQRT2 = math.sqrt(2)
+_INV_SQRT2 = 1 / _SQRT2
+
+# Uniform draws fetched per refill of the random-assignment buffer
+_RANDOM_BUFFER_SIZE = 4096
+
+# Recent (user -> variant) results kept per experiment for repeat lookups
+_ASSIGNMENT_CACHE_SIZE = 1 << 14
+
+# Intervals in each tabulated O'Brien-Fleming boundary (per alpha)
+_OBF_TABLE_SIZE = 1024
+
+
+def _prefixed_bucket_function(
+    algorithm: HashAlgorithm,
+    prefix: bytes,
+) -> Callable[[bytes], float]:
+    """
+    Return a function mapping user-id bytes to a bucket in [0, 1).
+
+    The hash state for the fixed prefix is built once and cloned with
+    ``copy()`` per call, so only the user id is hashed each time.
+    """
+    if algorithm == HashAlgorithm.BLAKE2B:
+        blake2b_base = hashlib.blake2b(prefix, digest_size=8)
+
+        def blake2b_bucket(user_bytes: bytes) -> float:
+            hasher = blake2b_base.copy()
+            hasher.update(user_bytes)
+            return int.from_bytes(hasher.digest(), "big") / 2**64
+
+        return blake2b_bucket
+
+    md5_base = hashlib.md5(prefix)
+
+    def md5_bucket(user_bytes: bytes) -> float:
+        hasher = md5_base.copy()
+        hasher.update(user_bytes)
+        return (int.from_bytes(hasher.digest(), "big") % 10000) / 10000
+
+    return md5_bucket
+
+
+def _normal_cdf(x: float) -> float:
+    """Approximate standard normal CDF."""
+    return 0.5 * (1 + math.erf(x / _SQRT2))
+
+
+def _inverse_normal_cdf(p: float) -> float:
+    """Inverse normal CDF (quantile function), clamped to +/-4 at the edges."""
+    if p <= 0:
+        return -4.0
+    if p >= 1:
+        return 4.0
+    return float(special.ndtri(p))
+
+
+def _inverse_normal_cdf_vec(p: np.ndarray) -> np.ndarray:
+    """Inverse normal CDF over an array, clamped to +/-4 like the scalar version."""
+    p = np.asarray(p, dtype=np.float64)
+    return np.where(p <= 0, -4.0, np.where(p >= 1, 4.0, special.ndtri(p)))
+
+
+def _welch_compare_batch(
+    control: "VariantMetrics",
+    treatments: List["VariantMetrics"],
+) -> List[Tuple[float, float]]:
+    """
+    Compare several treatments to one control with Welch's t-test.
+
+    Control-side terms are computed once for the whole batch.
+
+    Returns a (relative_lift, p_value) pair per treatment.
+    """
+    n1 = control.sample_size
+    if n1 == 0:
+        return [(0.0, 1.0)] * len(treatments)
+
+    mean1 = control.mean_value
+    var1 = control.std_value ** 2 if control.std_value > 0 else 0.001
+    var1_n = var1 / n1
+
+    results = []
+    for treatment in treatments:
+        n2 = treatment.sample_size
+        if n2 == 0:
+            results.append((0.0, 1.0))
+            continue
+
+        mean2 = treatment.mean_value
+        lift = (mean2 - mean1) / mean1 if mean1 != 0 else 0.0
+
+        var2 = treatment.std_value ** 2 if treatment.std_value > 0 else 0.001
+        se = math.sqrt(var1_n + var2 / n2)
+        if se == 0:
+            results.append((lift, 1.0))
+            continue
+
+        t_stat = (mean2 - mean1) / se
+        # Two-sided normal p-value; erfc avoids 1 - cdf cancellation in the tail
+        results.append((lift, math.erfc(abs(t_stat) * _INV_SQRT2)))
+
+    return results
+
+
+def _welch_compare_arrays(
+    n1: np.ndarray,
+    mean1: np.ndarray,
+    std1: np.ndarray,
+    n2: np.ndarray,
+    mean2: np.ndarray,
+    std2: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized form of ``_welch_compare_batch`` over independent pairs.
+
+    Element i compares treatment (n2, mean2, std2)[i] to control
+    (n1, mean1, std1)[i]. Returns (relative_lift, p_value) arrays.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var1 = np.where(std1 > 0, std1 * std1, 0.001)
+        var2 = np.where(std2 > 0, std2 * std2, 0.001)
+        se = np.sqrt(var1 / n1 + var2 / n2)
+        diff = mean2 - mean1
+        lift = np.where(mean1 != 0, diff / mean1, 0.0)
+        p_value = np.where(se > 0, special.erfc(np.abs(diff / se) * _INV_SQRT2), 1.0)
+
+    empty = (n1 == 0) | (n2 == 0)
+    return np.where(empty, 0.0, lift), np.where(empty, 1.0, p_value)
 
 
 class ABTestAnalyzer:
@@ -132,19 +418,69 @@ class ABTestAnalyzer:
     - Guardrail monitoring
     """
 
-    def __init__(self, salt: str = "scholaros_ab"):
+    def __init__(
+        self,
+        salt: str = "scholaros_ab",
+        hash_algorithm: HashAlgorithm = HashAlgorithm.MD5,
+    ):
         """
         Initialize the analyzer.
 
         Args:
             salt: Salt for deterministic assignment
+            hash_algorithm: Hash used for bucketing. Switching away from MD5
+                reshuffles users, so only do it for new experiments.
         """
         self.salt = salt
+        self.hash_algorithm = hash_algorithm
         self.experiments: Dict[str, ExperimentConfig] = {}
+        self._assigners: Dict[str, Callable[[str], str]] = {}
+        self._rng = np.random.default_rng()
+        self._rand_buf: List[float] = []
+        self._rand_idx = 0
+        self._obf_tables: Dict[float, List[float]] = {}
 
     def register_experiment(self, config: ExperimentConfig) -> None:
         """Register an experiment configuration."""
+        config.compile_targeting_rules()
         self.experiments[config.experiment_id] = config
+        self._assigners[config.experiment_id] = self._build_assigner(config)
+
+    def _build_assigner(self, config: ExperimentConfig) -> Callable[[str], str]:
+        """
+        Build a deterministic assign function specialized to one experiment.
+
+        The prefix hash state and variant table are bound once; two-variant
+        experiments reduce to a single threshold comparison. Results for
+        recently seen users are memoized, since the same users are assigned
+        on every page load; ``__wrapped__`` is the uncached function.
+        """
+        prefix = f"{self.salt}:{config.experiment_id}:".encode()
+        hash_bucket = _prefixed_bucket_function(self.hash_algorithm, prefix)
+
+        if len(config._variant_names) == 2:
+            first, second = config._variant_names
+            threshold = config._cumulative_weights[0]
+
+            def assign(user_id: str) -> str:
+                if hash_bucket(user_id.encode()) < threshold:
+                    return first
+                return second
+        else:
+            variant_for_bucket = config.variant_for_bucket
+
+            def assign(user_id: str) -> str:
+                return variant_for_bucket(hash_bucket(user_id.encode()))
+
+        return functools.lru_cache(maxsize=_ASSIGNMENT_CACHE_SIZE)(assign)
+
+    def _get_assigner(self, config: ExperimentConfig) -> Callable[[str], str]:
+        """Return the cached assign function for an experiment."""
+        assign = self._assigners.get(config.experiment_id)
+        if assign is None:
+            assign = self._build_assigner(config)
+            self._assigners[config.experiment_id] = assign
+        return assign
 
     def assign_variant(
         self,
@@ -169,67 +505,109 @@ class ABTestAnalyzer:
 
         # Check targeting rules
         if config.targeting_rules and context:
-            if not self._check_targeting(config.targeting_rules, context):
+            if not self._check_targeting(config, context):
                 return None
 
         # Assign based on strategy
         if config.assignment_strategy == AssignmentStrategy.DETERMINISTIC:
-            return self._deterministic_assign(experiment_id, user_id, config.variants)
+            return self._deterministic_assign(experiment_id, user_id, config)
         elif config.assignment_strategy == AssignmentStrategy.RANDOM:
-            return self._random_assign(config.variants)
+            return self._random_assign(config)
         else:
-            return self._stratified_assign(config.variants, context)
+            return self._stratified_assign(config, context)
 
     def _deterministic_assign(
         self,
         experiment_id: str,
         user_id: str,
-        variants: List[Variant],
+        config: ExperimentConfig,
     ) -> str:
         """Hash-based deterministic assignment."""
-        hash_input = f"{self.salt}:{experiment_id}:{user_id}"
-        hash_value = int(hashlib.md5(hash_input.encode()).hexdigest(), 16)
-        bucket = (hash_value % 10000) / 10000  # 0.0000 - 0.9999
+        return self._get_assigner(config)(user_id)
+
+    def assign_variants_bulk(
+        self,
+        experiment_id: str,
+        user_ids: List[str],
+    ) -> List[str]:
+        """
+        Deterministically assign many users at once.
+
+        Produces the same mapping as ``_deterministic_assign``; suited to
+        experiment backfills and simulations.
+
+        Args:
+            experiment_id: Experiment to assign for
+            user_ids: Users to assign
+
+        Returns:
+            Variant names in the same order as ``user_ids``
+        """
+        config = self.experiments.get(experiment_id)
+        if not config:
+            raise ValueError(f"Experiment {experiment_id} not found")
 
-        cumulative = 0.0
-        for variant in variants:
-            cumulative += variant.weight
-            if bucket < cumulative:
-                return variant.name
+        # Backfills mostly see each user once, so bypass the hot-user cache
+        assign = self._get_assigner(config).__wrapped__
+        return [assign(user_id) for user_id in user_ids]
 
-        return variants[-1].name
+    def assign_variants_random_bulk(self, experiment_id: str, n: int) -> List[str]:
+        """
+        Randomly assign n users at once, e.g. for Monte-Carlo simulation.
+
+        Args:
+            experiment_id: Experiment to assign for
+            n: Number of assignments to draw
+
+        Returns:
+            Variant names drawn according to the variant weights
+        """
+        config = self.experiments.get(experiment_id)
+        if not config:
+            raise ValueError(f"Experiment {experiment_id} not found")
+
+        draws = self._rng.random(n)
+        indices = np.searchsorted(config._cumulative_weights, draws, side="right")
+        np.minimum(indices, len(config._variant_names) - 1, out=indices)
+        names = config._variant_names
+        return [names[i] for i in indices.tolist()]
 
-    def _random_assign(self, variants: List[Variant]) -> str:
+    def _random_assign(self, config: ExperimentConfig) -> str:
         """Random assignment based on weights."""
-        rand = random.random()
-        cumulative = 0.0
-        for variant in variants:
-            cumulative += variant.weight
-            if rand < cumulative:
-                return variant.name
-        return variants[-1].name
+        return config.variant_for_bucket(self._next_random())
+
+    def _next_random(self) -> float:
+        """Return the next uniform draw, refilling the buffer in batches."""
+        if self._rand_idx >= len(self._rand_buf):
+            self._rand_buf = self._rng.random(_RANDOM_BUFFER_SIZE).tolist()
+            self._rand_idx = 0
+        value = self._rand_buf[self._rand_idx]
+        self._rand_idx += 1
+        return value
 
     def _stratified_assign(
         self,
-        variants: List[Variant],
+        config: ExperimentConfig,
         context: Optional[Dict[str, Any]],
     ) -> str:
         """Stratified assignment (balances across segments)."""
         # For MVP, fall back to random
-        return self._random_assign(variants)
+        return self._random_assign(config)
 
     def _check_targeting(
         self,
-        rules: Dict[str, Any],
+        config: ExperimentConfig,
         context: Dict[str, Any],
     ) -> bool:
-        """Check if context matches targeting rules."""
-        for key, expected in rules.items():
-            actual = context.get(key)
-            if isinstance(expected, list):
-                if actual not in expected:
+        """Check if context matches the config's compiled targeting rules."""
+        for key, expected in config._eq_rules.items():
+            if context.get(key) != expected:
+                return False
+        for key, allowed in config._set_rules.items():
+            try:
+                if context.get(key) not in allowed:
                     return False
-            elif actual != expected:
+            except TypeError:  # Unhashable context value
                 return False
         return True
 
@@ -238,6 +616,8 @@ class ABTestAnalyzer:
         experiment_id: str,
         data: Dict[str, List[float]],
         metric_name: str,
+        now: Optional[datetime] = None,
+        bootstrap_iterations: int = 0,
     ) -> ExperimentResult:
         """
         Analyze experiment results.
@@ -246,6 +626,10 @@ class ABTestAnalyzer:
             experiment_id: Experiment to analyze
             data: Dict mapping variant names to metric values
             metric_name: Name of metric being analyzed
+            now: Analysis timestamp (UTC). Pass one shared value when
+                analyzing many experiments in a batch; defaults to utcnow().
+            bootstrap_iterations: If positive, resample this many times to
+                attach a 95% confidence interval for the best lift.
 
         Returns:
             ExperimentResult with statistical analysis
@@ -254,44 +638,139 @@ class ABTestAnalyzer:
         if not config:
             raise ValueError(f"Experiment {experiment_id} not found")
 
-        # Build variant metrics
+        variant_metrics = self._build_variant_metrics(config, data)
+
+        # Compare each treatment to control
+        control = next(v for v in config.variants if v.is_control)
+        treatments = [v for v in config.variants if not v.is_control]
+        comparisons = _welch_compare_batch(
+            variant_metrics[control.name],
+            [variant_metrics[v.name] for v in treatments],
+        )
+
+        return self._build_result(
+            config, variant_metrics, comparisons, now, bootstrap_iterations
+        )
+
+    def analyze_many(
+        self,
+        batch: Dict[str, Dict[str, List[float]]],
+        metric_name: str,
+        now: Optional[datetime] = None,
+        bootstrap_iterations: int = 0,
+    ) -> Dict[str, ExperimentResult]:
+        """
+        Analyze many experiments at once.
+
+        Every treatment-vs-control comparison across the batch is evaluated
+        in a single vectorized Welch test instead of one call per experiment.
+
+        Args:
+            batch: Dict mapping experiment IDs to ``analyze``-style data
+            metric_name: Name of metric being analyzed
+            now: Analysis timestamp (UTC) shared by all results
+            bootstrap_iterations: As for ``analyze``
+
+        Returns:
+            Dict mapping experiment IDs to their ExperimentResult
+        """
+        if now is None:
+            now = datetime.utcnow()
+
+        prepared = []
+        pairs: List[Tuple[VariantMetrics, VariantMetrics]] = []
+        for experiment_id, data in batch.items():
+            config = self.experiments.get(experiment_id)
+            if not config:
+                raise ValueError(f"Experiment {experiment_id} not found")
+
+            variant_metrics = self._build_variant_metrics(config, data)
+            control = next(v for v in config.variants if v.is_control)
+            control_metrics = variant_metrics[control.name]
+            start = len(pairs)
+            pairs.extend(
+                (control_metrics, variant_metrics[v.name])
+                for v in config.variants
+                if not v.is_control
+            )
+            prepared.append((config, variant_metrics, start, len(pairs)))
+
+        lifts, p_values = _welch_compare_arrays(
+            np.array([c.sample_size for c, _ in pairs], dtype=np.float64),
+            np.array([c.mean_value for c, _ in pairs], dtype=np.float64),
+            np.array([c.std_value for c, _ in pairs], dtype=np.float64),
+            np.array([t.sample_size for _, t in pairs], dtype=np.float64),
+            np.array([t.mean_value for _, t in pairs], dtype=np.float64),
+            np.array([t.std_value for _, t in pairs], dtype=np.float64),
+        )
+        comparisons = list(zip(lifts.tolist(), p_values.tolist()))
+
+        return {
+            config.experiment_id: self._build_result(
+                config, variant_metrics, comparisons[start:end], now, bootstrap_iterations
+            )
+            for config, variant_metrics, start, end in prepared
+        }
+
+    def _build_variant_metrics(
+        self,
+        config: ExperimentConfig,
+        data: Dict[str, List[float]],
+    ) -> Dict[str, VariantMetrics]:
+        """Compute per-variant statistics for an experiment's raw data."""
         variant_metrics: Dict[str, VariantMetrics] = {}
         for variant in config.variants:
-            values = data.get(variant.name, [])
+            values = np.asarray(data.get(variant.name, ()), dtype=np.float64)
             metrics = VariantMetrics(
                 variant_name=variant.name,
-                sample_size=len(values),
+                sample_size=int(values.size),
                 values=values,
             )
             metrics.compute_stats()
             variant_metrics[variant.name] = metrics
+        return variant_metrics
+
+    def _build_result(
+        self,
+        config: ExperimentConfig,
+        variant_metrics: Dict[str, VariantMetrics],
+        comparisons: List[Tuple[float, float]],
+        now: Optional[datetime],
+        bootstrap_iterations: int = 0,
+    ) -> ExperimentResult:
+        """
+        Turn treatment comparisons into an ExperimentResult.
 
-        # Find control
+        ``comparisons`` holds a (relative_lift, p_value) pair per treatment,
+        in variant order.
+        """
         control = next(v for v in config.variants if v.is_control)
         control_metrics = variant_metrics[control.name]
+        treatments = [v for v in config.variants if not v.is_control]
 
-        # Compare each treatment to control
         best_treatment = None
         best_lift = 0.0
         best_p_value = 1.0
 
-        for variant in config.variants:
-            if variant.is_control:
-                continue
-
-            treatment_metrics = variant_metrics[variant.name]
-            lift, p_value = self._compare_variants(
-                control_metrics, treatment_metrics
-            )
-
+        for variant, (lift, p_value) in zip(treatments, comparisons):
             if lift > best_lift:
                 best_treatment = variant.name
                 best_lift = lift
                 best_p_value = p_value
 
+        confidence_interval = None
+        if bootstrap_iterations > 0 and best_treatment is not None:
+            confidence_interval = bootstrap_lift_ci(
+                control_metrics.values,
+                variant_metrics[best_treatment].values,
+                n_iters=bootstrap_iterations,
+            )
+
         # Determine if we can conclude
         total_sample = sum(m.sample_size for m in variant_metrics.values())
-        days_running = (datetime.utcnow() - config.created_at).days
+        if now is None:
+            now = datetime.utcnow()
+        days_running = (now - config.created_at).days
 
         is_significant = best_p_value < config.alpha
         has_enough_samples = total_sample >= config.minimum_sample_size
@@ -310,9 +789,11 @@ class ABTestAnalyzer:
         )
 
         return ExperimentResult(
-            experiment_id=experiment_id,
-            analysis_date=datetime.utcnow(),
-            variant_metrics=variant_metrics,
+            experiment_id=config.experiment_id,
+            analysis_date=now,
+            variant_metrics={
+                name: metrics.to_summary() for name, metrics in variant_metrics.items()
+            },
             control_name=control.name,
             winner=winner,
             relative_lift=best_lift,
@@ -324,6 +805,7 @@ class ABTestAnalyzer:
             total_sample_size=total_sample,
             can_conclude=can_conclude,
             recommendation=recommendation,
+            confidence_interval=confidence_interval,
         )
 
     def _compare_variants(
@@ -336,34 +818,11 @@ class ABTestAnalyzer:
 
         Returns (relative_lift, p_value)
         """
-        if control.sample_size == 0 or treatment.sample_size == 0:
-            return 0.0, 1.0
-
-        # Calculate lift
-        if control.mean_value != 0:
-            lift = (treatment.mean_value - control.mean_value) / control.mean_value
-        else:
-            lift = 0.0
-
-        # Two-sample t-test (Welch's)
-        n1, n2 = control.sample_size, treatment.sample_size
-        mean1, mean2 = control.mean_value, treatment.mean_value
-        var1 = control.std_value ** 2 if control.std_value > 0 else 0.001
-        var2 = treatment.std_value ** 2 if treatment.std_value > 0 else 0.001
-
-        se = math.sqrt(var1 / n1 + var2 / n2)
-        if se == 0:
-            return lift, 1.0
-
-        t_stat = (mean2 - mean1) / se
-        # Approximate p-value using normal distribution
-        p_value = 2 * (1 - self._normal_cdf(abs(t_stat)))
-
-        return lift, p_value
+        return _welch_compare_batch(control, [treatment])[0]
 
     def _normal_cdf(self, x: float) -> float:
         """Approximate standard normal CDF."""
-        return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+        return _normal_cdf(x)
 
     def _estimate_power(
         self,
@@ -449,7 +908,7 @@ class ABTestAnalyzer:
         else:
             z_score = 4.0  # Very significant
 
-        z_boundary = self._inverse_normal_cdf(boundary / 2) if boundary > 0 else 4.0
+        z_boundary = -self._inverse_normal_cdf(boundary / 2) if boundary > 0 else 4.0
 
         can_stop_early = z_score > z_boundary and information_fraction >= 0.5
 
@@ -472,73 +931,33 @@ class ABTestAnalyzer:
         alpha: float,
         information_fraction: float,
     ) -> float:
-        """O'Brien-Fleming alpha spending function."""
+        """
+        O'Brien-Fleming alpha spending function.
+
+        Interpolated from a table built once per alpha, since interim looks
+        reuse the same alpha with different information fractions. The
+        interpolation is within about 1e-7 of the exact curve.
+        """
         if information_fraction <= 0:
             return 0.0
         if information_fraction >= 1:
             return alpha
 
-        # O'Brien-Fleming spending: very conservative early
-        z_alpha = self._inverse_normal_cdf(alpha / 2)
-        z_t = z_alpha / math.sqrt(information_fraction)
+        table = self._obf_tables.get(alpha)
+        if table is None:
+            fractions = np.linspace(0.0, 1.0, _OBF_TABLE_SIZE + 1)
+            fractions[0] = np.finfo(np.float64).tiny  # Limit as fraction -> 0+
+            table = obrien_fleming_boundary_curve(alpha, fractions).tolist()
+            self._obf_tables[alpha] = table
 
-        spent = 2 * (1 - self._normal_cdf(z_t))
-        return min(spent, alpha)
+        position = information_fraction * _OBF_TABLE_SIZE
+        index = int(position)
+        lower = table[index]
+        return lower + (table[index + 1] - lower) * (position - index)
 
     def _inverse_normal_cdf(self, p: float) -> float:
         """Approximate inverse normal CDF (quantile function)."""
-        if p <= 0:
-            return -4.0
-        if p >= 1:
-            return 4.0
-
-        # Rational approximation
-        a = [
-            -3.969683028665376e+01,
-            2.209460984245205e+02,
-            -2.759285104469687e+02,
-            1.383577518672690e+02,
-            -3.066479806614716e+01,
-            2.506628277459239e+00,
-        ]
-        b = [
-            -5.447609879822406e+01,
-            1.615858368580409e+02,
-            -1.556989798598866e+02,
-            6.680131188771972e+01,
-            -1.328068155288572e+01,
-        ]
-        c = [
-            -7.784894002430293e-03,
-            -3.223964580411365e-01,
-            -2.400758277161838e+00,
-            -2.549732539343734e+00,
-            4.374664141464968e+00,
-            2.938163982698783e+00,
-        ]
-        d = [
-            7.784695709041462e-03,
-            3.224671290700398e-01,
-            2.445134137142996e+00,
-            3.754408661907416e+00,
-        ]
-
-        p_low = 0.02425
-        p_high = 1 - p_low
-
-        if p < p_low:
-            q = math.sqrt(-2 * math.log(p))
-            return (((((c[0]*q + c[1])*q + c[2])*q + c[3])*q + c[4])*q + c[5]) / \
-                   ((((d[0]*q + d[1])*q + d[2])*q + d[3])*q + 1)
-        elif p <= p_high:
-            q = p - 0.5
-            r = q * q
-            return (((((a[0]*r + a[1])*r + a[2])*r + a[3])*r + a[4])*r + a[5])*q / \
-                   (((((b[0]*r + b[1])*r + b[2])*r + b[3])*r + b[4])*r + 1)
-        else:
-            q = math.sqrt(-2 * math.log(1 - p))
-            return -(((((c[0]*q + c[1])*q + c[2])*q + c[3])*q + c[4])*q + c[5]) / \
-                    ((((d[0]*q + d[1])*q + d[2])*q + d[3])*q + 1)
+        return _inverse_normal_cdf(p)
 
 
 def calculate_experiment_duration(
@@ -563,6 +982,22 @@ def calculate_experiment_duration(
     Returns:
         Dict with duration estimates
     """
+    # Results are memoized; hand out a copy so callers can't alter the cache
+    return dict(_experiment_duration(
+        baseline_rate, minimum_detectable_effect, daily_traffic, num_variants, alpha, power
+    ))
+
+
+@functools.lru_cache(maxsize=1024)
+def _experiment_duration(
+    baseline_rate: float,
+    minimum_detectable_effect: float,
+    daily_traffic: int,
+    num_variants: int,
+    alpha: float,
+    power: float,
+) -> Dict[str, Any]:
+    """Memoized implementation of ``calculate_experiment_duration``."""
     # Sample size per variant
     z_alpha = 1.96 if alpha == 0.05 else 2.576
     z_beta = 0.84 if power == 0.80 else 1.28
@@ -590,3 +1025,96 @@ def calculate_experiment_duration(
         "minimum_detectable_effect": minimum_detectable_effect,
         "baseline_rate": baseline_rate,
     }
+
+
+def obrien_fleming_boundary_curve(
+    alpha: float,
+    information_fractions: Any,
+) -> np.ndarray:
+    """
+    O'Brien-Fleming alpha spent at each of many interim looks.
+
+    Evaluates the spending function exactly; ``ABTestAnalyzer`` tabulates it
+    per alpha for interim looks.
+
+    Args:
+        alpha: Overall significance level
+        information_fractions: Array-like of information fractions
+
+    Returns:
+        Array of alpha spent, same shape as ``information_fractions``
+    """
+    fractions = np.asarray(information_fractions, dtype=np.float64)
+    z_alpha = _inverse_normal_cdf_vec(1 - alpha / 2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z_t = z_alpha / np.sqrt(fractions)
+    spent = np.minimum(special.erfc(z_t * _INV_SQRT2), alpha)
+
+    return np.where(fractions <= 0, 0.0, np.where(fractions >= 1, alpha, spent))
+
+
+# Bootstrap resample indices generated per chunk, bounding peak memory
+_BOOTSTRAP_CHUNK_ELEMENTS = 1 << 22
+
+
+def bootstrap_lift_ci(
+    control: Any,
+    treatment: Any,
+    n_iters: int = 10000,
+    seed: int = 0,
+    confidence: float = 0.95,
+) -> Tuple[float, float]:
+    """
+    Percentile bootstrap confidence interval for relative lift.
+
+    Both samples are resampled with replacement and the lift of the
+    resampled means, (treatment - control) / control, is collected. The
+    resampling is vectorized in chunks of iterations.
+
+    Args:
+        control: Control observations
+        treatment: Treatment observations
+        n_iters: Number of bootstrap iterations
+        seed: Seed for reproducible intervals
+        confidence: Two-sided confidence level
+
+    Returns:
+        (lower, upper) bounds of the interval
+    """
+    control = np.asarray(control, dtype=np.float64)
+    treatment = np.asarray(treatment, dtype=np.float64)
+    if not control.size or not treatment.size or n_iters <= 0:
+        return (0.0, 0.0)
+
+    rng = np.random.default_rng(seed)
+    control_means = _bootstrap_means(rng, control, n_iters)
+    treatment_means = _bootstrap_means(rng, treatment, n_iters)
+
+    # Same convention as the point estimate: zero control mean -> zero lift
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lifts = np.where(
+            control_means != 0,
+            (treatment_means - control_means) / control_means,
+            0.0,
+        )
+
+    tail = (1 - confidence) / 2
+    lower, upper = np.quantile(lifts, [tail, 1 - tail])
+    return (float(lower), float(upper))
+
+
+def _bootstrap_means(
+    rng: np.random.Generator,
+    values: np.ndarray,
+    n_iters: int,
+) -> np.ndarray:
+    """Means of n_iters resamples (with replacement) of values."""
+    n = values.size
+    rows = max(1, _BOOTSTRAP_CHUNK_ELEMENTS // n)
+    means = np.empty(n_iters, dtype=np.float64)
+    for start in range(0, n_iters, rows):
+        stop = min(start + rows, n_iters)
+        indices = rng.integers(0, n, size=(stop - start, n))
+        means[start:stop] = values[indices].mean(axis=1)
+    return means
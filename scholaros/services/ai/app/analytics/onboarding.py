@@ -8,15 +8,25 @@ Provides comprehensive analytics for user onboarding flows:
 - Risk scoring for churn prediction
 """
 
+from array import array
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from enum import Enum
-import statistics
+import math
+import warnings
+
+import numpy as np
 
 
 class FunnelStage(Enum):
-    """Onboarding funnel stages."""
+    """
+    Onboarding funnel stages, declared in funnel order.
+
+    Each stage also carries ``code``, its contiguous 0-based position, for
+    indexing per-stage arrays without hashing enum members.
+    """
     SIGNUP = "signup"
     PROFILE_COMPLETE = "profile_complete"
     WORKSPACE_CREATED = "workspace_created"
@@ -24,8 +34,236 @@ class FunnelStage(Enum):
     TUTORIAL_COMPLETE = "tutorial_complete"
     ACTIVATED = "activated"
 
+    def __new__(cls, value: str) -> "FunnelStage":
+        member = object.__new__(cls)
+        member._value_ = value
+        member.code = len(cls.__members__)
+        return member
+
+
+# Event names that mark entry into each funnel stage
+_EVENT_STAGES: Mapping[str, FunnelStage] = MappingProxyType({
+    "onboarding_started": FunnelStage.SIGNUP,
+    "profile_completed": FunnelStage.PROFILE_COMPLETE,
+    "workspace_created": FunnelStage.WORKSPACE_CREATED,
+    "first_task_created": FunnelStage.FIRST_TASK,
+    "tutorial_completed": FunnelStage.TUTORIAL_COMPLETE,
+    "onboarding_completed": FunnelStage.ACTIVATED,
+})
+_EVENT_STAGE_CODES: Dict[str, int] = {
+    name: stage.code for name, stage in _EVENT_STAGES.items()
+}
+
+# Sentinel for "stage not reached" in int64 timestamp matrices
+_MISSING_TS = np.iinfo(np.int64).min
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Quantiles reported for stage and time-to-value durations
+_QUANTILES = (0.5, 0.75, 0.9)
+
+
+def _epoch_microseconds(ts: datetime) -> int:
+    """Microseconds since the Unix epoch (naive datetimes are taken as UTC)."""
+    epoch = _EPOCH if ts.tzinfo is None else _EPOCH_UTC
+    return (ts - epoch) // _ONE_MICROSECOND
+
+
+def _parse_timestamps(values: List[Any]) -> np.ndarray:
+    """
+    Parse ISO-8601 timestamps into int64 epoch microseconds in one call.
+
+    numpy's C parser handles the common naive form. Anything it rejects or
+    would silently reinterpret (UTC offsets, "NaT", datetime objects) goes
+    through datetime.fromisoformat value by value instead.
+    """
+    try:
+        with warnings.catch_warnings():
+            # numpy only warns when it folds a UTC offset into the value
+            warnings.simplefilter("error")
+            parsed = np.array(values, dtype="datetime64[us]")
+        if not np.isnat(parsed).any():
+            return parsed.astype(np.int64)
+    except (ValueError, TypeError, UserWarning, DeprecationWarning):
+        pass
+
+    return np.fromiter(
+        (_epoch_microseconds(datetime.fromisoformat(value)) for value in values),
+        dtype=np.int64,
+        count=len(values),
+    )
+
+
+def _stage_timestamp_matrix(
+    rows: List[int],
+    columns: List[int],
+    timestamps: np.ndarray,
+    num_users: int,
+    num_stages: int,
+) -> np.ndarray:
+    """
+    Pivot (user row, stage column, timestamp) triples into a dense matrix.
+
+    Cells for stages a user never reached hold _MISSING_TS. If a user hits a
+    stage more than once, the earliest event wins, so the result does not
+    depend on event order and matches merging the events in batches.
+    """
+    ts = np.full((num_users, num_stages), _MISSING_TS, dtype=np.int64)
+    if timestamps.size:
+        cells = np.asarray(rows, dtype=np.int64) * num_stages + np.asarray(columns)
+        flat = np.full(num_users * num_stages, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(flat, cells, timestamps)
+        reached = flat != np.iinfo(np.int64).max
+        ts.reshape(-1)[reached] = flat[reached]
+    return ts
+
+
+def _percentiles(times: Any) -> Tuple[float, float, float]:
+    """
+    Median, p75 and p90 of a non-empty sample.
+
+    Quantiles are linearly interpolated between order statistics (numpy's
+    default, and what most statistics tools report), so small samples no
+    longer round p90 up to the maximum. np.quantile selects the needed
+    order statistics by partitioning rather than a full sort.
+    """
+    median, p75, p90 = np.quantile(np.asarray(times, dtype=np.float64), _QUANTILES)
+    return float(median), float(p75), float(p90)
+
+
+def _funnel_kernel(
+    ts: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[np.ndarray]]:
+    """
+    Reduce a users x stages timestamp matrix to per-stage funnel statistics.
+
+    Returns (reached, dropped, median_seconds, p90_seconds, stage_times),
+    one entry per stage. A stage counts as reached only if every earlier
+    stage was too; dropped counts users who reached the previous stage but
+    not this one. Times are seconds since the previous stage; median/p90
+    are NaN where no user reached the stage (always the first stage).
+    """
+    num_stages = ts.shape[1]
+    present = ts != _MISSING_TS
+    reached = np.logical_and.accumulate(present, axis=1)
+
+    dropped = np.zeros(num_stages, dtype=np.int64)
+    dropped[1:] = np.count_nonzero(reached[:, :-1] & ~present[:, 1:], axis=0)
+
+    median = np.full(num_stages, np.nan)
+    p90 = np.full(num_stages, np.nan)
+    stage_times = [np.empty(0)]
+    # Column i - 1 is the time spent reaching stage i
+    stage_seconds = np.diff(ts, axis=1) / 1e6
+    for i in range(1, num_stages):
+        times = stage_seconds[reached[:, i], i - 1]
+        stage_times.append(times)
+        if times.size:
+            median[i], _, p90[i] = _percentiles(times)
+
+    return np.count_nonzero(reached, axis=0), dropped, median, p90, stage_times
+
+
+def _biggest_drop_off(completed: np.ndarray) -> Tuple[Optional[int], float]:
+    """
+    Locate the largest stage-to-stage drop in a funnel's completion counts.
 
-@dataclass
+    Returns (stage position, drop rate), or (None, 0.0) if no stage loses
+    users. Stages whose predecessor has no users are ignored, and ties go
+    to the earliest stage.
+    """
+    prev = completed[:-1]
+    drop_rates = np.zeros(prev.size)
+    np.subtract(1.0, completed[1:] / np.maximum(prev, 1), out=drop_rates, where=prev > 0)
+    if not drop_rates.size:
+        return None, 0.0
+    i = int(np.argmax(drop_rates))
+    if drop_rates[i] <= 0.0:
+        return None, 0.0
+    return i + 1, float(drop_rates[i])
+
+
+class DurationSketch:
+    """
+    Mergeable quantile sketch for stage durations (DDSketch-style).
+
+    Values are counted in logarithmic buckets, so quantile estimates are
+    within ``relative_accuracy`` of the true value while memory grows with
+    the log of the value range rather than with the number of samples.
+    Sketches with the same accuracy can be merged, e.g. to combine stage
+    timings computed by separate workers.
+    """
+
+    __slots__ = ("relative_accuracy", "count", "zero_count", "_gamma", "_log_gamma",
+                 "_positive", "_negative")
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.count = 0
+        self.zero_count = 0
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        # Bucket key -> count; key k holds magnitudes in (gamma^(k-1), gamma^k]
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+
+    def update_batch(self, values: Any) -> None:
+        """Add an array of values."""
+        arr = np.asarray(values, dtype=np.float64).ravel()
+        positive = arr[arr > 0]
+        negative = arr[arr < 0]
+        self._add(self._positive, positive)
+        self._add(self._negative, -negative)
+        self.zero_count += arr.size - positive.size - negative.size
+        self.count += arr.size
+
+    def _add(self, store: Dict[int, int], magnitudes: np.ndarray) -> None:
+        if not magnitudes.size:
+            return
+        keys = np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+        unique_keys, counts = np.unique(keys, return_counts=True)
+        for key, count in zip(unique_keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+    def merge(self, other: "DurationSketch") -> None:
+        """Fold another sketch with the same accuracy into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Can only merge sketches with the same relative accuracy")
+        for store, other_store in ((self._positive, other._positive),
+                                   (self._negative, other._negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile (0 <= q <= 1); 0.0 if the sketch is empty."""
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self._positive)) if self._positive else 0.0
+
+    def _bucket_value(self, key: int) -> float:
+        """Representative value of a bucket, within relative_accuracy of its range."""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+
+@dataclass(slots=True)
 class FunnelMetrics:
     """Metrics for a single funnel stage."""
     stage: FunnelStage
@@ -35,6 +273,10 @@ class FunnelMetrics:
     median_time_seconds: float = 0.0
     p90_time_seconds: float = 0.0
     conversion_rate: float = 0.0
+    # Approximate time-in-stage distribution over every user seen so far
+    time_sketch: DurationSketch = field(
+        default_factory=DurationSketch, repr=False, compare=False
+    )
 
     def compute_conversion(self) -> None:
         """Compute conversion rate from counts."""
@@ -44,7 +286,7 @@ class FunnelMetrics:
             self.conversion_rate = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class OnboardingCohort:
     """A cohort of users for funnel analysis."""
     cohort_id: str
@@ -52,6 +294,25 @@ class OnboardingCohort:
     end_date: datetime
     user_ids: List[str] = field(default_factory=list)
     stage_metrics: Dict[FunnelStage, FunnelMetrics] = field(default_factory=dict)
+    # Bumped whenever stage_metrics change; keys the derived-report caches
+    version: int = 0
+    _summary_cache: Optional[Tuple[int, Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _rates_cache: Optional[Tuple[int, Dict[FunnelStage, float]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Stage entry times over every batch seen: one row per user in
+    # _stage_user_ids, one column per stage code, epoch microseconds
+    _stage_user_ids: List[str] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _stage_ts: np.ndarray = field(
+        default_factory=lambda: np.full((0, len(FunnelStage)), _MISSING_TS, dtype=np.int64),
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     @property
     def size(self) -> int:
@@ -71,7 +332,7 @@ class OnboardingCohort:
         return activated_metrics.completed_count / signup_metrics.entered_count
 
 
-@dataclass
+@dataclass(slots=True)
 class DropOffAnalysis:
     """Analysis of drop-off at a specific stage."""
     stage: FunnelStage
@@ -81,7 +342,7 @@ class DropOffAnalysis:
     user_segments: Dict[str, float]  # segment -> drop-off rate
 
 
-@dataclass
+@dataclass(slots=True)
 class OnboardingJourney:
     """A single user's onboarding journey."""
     user_id: str
@@ -89,14 +350,22 @@ class OnboardingJourney:
     completed_at: Optional[datetime] = None
     current_stage: FunnelStage = FunnelStage.SIGNUP
     stage_timestamps: Dict[FunnelStage, datetime] = field(default_factory=dict)
-    interactions_per_stage: Dict[FunnelStage, int] = field(default_factory=dict)
+    # Interaction counts indexed by FunnelStage.code
+    interactions_per_stage: array = field(
+        default_factory=lambda: array("i", [0] * len(FunnelStage))
+    )
     is_complete: bool = False
     dropped_at_stage: Optional[FunnelStage] = None
 
-    @property
-    def total_duration_seconds(self) -> float:
-        """Total time from start to completion or current time."""
-        end = self.completed_at or datetime.utcnow()
+    def total_duration_seconds(self, now: Optional[datetime] = None) -> float:
+        """
+        Total time from start to completion or current time.
+
+        Args:
+            now: Current time (UTC) for unfinished journeys. Pass one shared
+                value when measuring many journeys; defaults to utcnow().
+        """
+        end = self.completed_at or now or datetime.utcnow()
         return (end - self.started_at).total_seconds()
 
     @property
@@ -104,6 +373,14 @@ class OnboardingJourney:
         """Number of stages completed."""
         return len(self.stage_timestamps)
 
+    def interactions_by_stage(self) -> Dict[FunnelStage, int]:
+        """Interaction counts keyed by stage, omitting stages with none."""
+        return {
+            stage: count
+            for stage, count in zip(FunnelStage, self.interactions_per_stage)
+            if count
+        }
+
 
 class OnboardingFunnelAnalyzer:
     """
@@ -125,6 +402,8 @@ class OnboardingFunnelAnalyzer:
         FunnelStage.TUTORIAL_COMPLETE,
         FunnelStage.ACTIVATED,
     ]
+    # Position of each stage in STAGE_ORDER (equal to FunnelStage.code)
+    STAGE_INDEX = {stage: i for i, stage in enumerate(STAGE_ORDER)}
 
     def __init__(self):
         self.cohorts: Dict[str, OnboardingCohort] = {}
@@ -171,6 +450,9 @@ class OnboardingFunnelAnalyzer:
         """
         Analyze a cohort's funnel performance from events.
 
+        The events are merged with those from earlier calls (see
+        update_cohort), so analyzing the same events again changes nothing.
+
         Args:
             cohort_id: Cohort to analyze
             events: List of onboarding events with user_id, event_name, timestamp
@@ -182,59 +464,180 @@ class OnboardingFunnelAnalyzer:
         if not cohort:
             raise ValueError(f"Cohort {cohort_id} not found")
 
-        # Build user journeys from events
-        user_journeys: Dict[str, OnboardingJourney] = {}
+        user_ids, ts = self._events_to_stage_matrix(cohort, events)
+        return self._apply_stage_matrix(cohort, user_ids, ts)
+
+    def update_cohort(
+        self,
+        cohort_id: str,
+        events_batch: List[Dict[str, Any]],
+    ) -> OnboardingCohort:
+        """
+        Merge a batch of new events into a cohort's funnel incrementally.
+
+        The cohort keeps its users x stages timestamp matrix between calls,
+        including those to analyze_cohort; each batch is merged into it (the
+        earliest time per user and stage wins) and the metrics are rebuilt
+        from the merged matrix. Refreshing therefore costs O(batch + users)
+        instead of re-scanning the whole event history, and replaying a batch
+        is a no-op.
+
+        Args:
+            cohort_id: Cohort to update
+            events_batch: New onboarding events with user_id, event_name, timestamp
+
+        Returns:
+            Updated OnboardingCohort with metrics
+        """
+        cohort = self.cohorts.get(cohort_id)
+        if not cohort:
+            raise ValueError(f"Cohort {cohort_id} not found")
+
+        user_ids, ts = self._events_to_stage_matrix(cohort, events_batch)
+        return self._apply_stage_matrix(cohort, user_ids, ts)
+
+    def _merge_stage_matrix(
+        self,
+        cohort: OnboardingCohort,
+        batch_user_ids: List[str],
+        batch_ts: np.ndarray,
+    ) -> Tuple[List[str], np.ndarray]:
+        """Merge a batch's stage matrix into the cohort's, earliest time winning."""
+        user_ids = list(cohort._stage_user_ids)
+        known = len(user_ids)
+        user_rows = {user_id: row for row, user_id in enumerate(user_ids)}
+        rows = np.fromiter(
+            (user_rows.setdefault(user_id, len(user_rows)) for user_id in batch_user_ids),
+            dtype=np.int64,
+            count=len(batch_user_ids),
+        )
+        user_ids.extend(user_id for user_id, row in zip(batch_user_ids, rows) if row >= known)
+
+        ts = np.full((len(user_rows), len(FunnelStage)), _MISSING_TS, dtype=np.int64)
+        ts[: len(cohort._stage_ts)] = cohort._stage_ts
+        stored = ts[rows]
+        ts[rows] = np.where(
+            (stored == _MISSING_TS) | ((batch_ts != _MISSING_TS) & (batch_ts < stored)),
+            batch_ts,
+            stored,
+        )
+        return user_ids, ts
+
+    def _events_to_stage_matrix(
+        self,
+        cohort: OnboardingCohort,
+        events: List[Dict[str, Any]],
+    ) -> Tuple[List[str], np.ndarray]:
+        """Collect a cohort's stage events into (user_ids, users x stages matrix)."""
+        # Flatten stage events into parallel columns (column = stage code)
+        members = frozenset(cohort.user_ids)  # O(1) membership per event
+        user_rows: Dict[str, int] = {}
+        rows: List[int] = []
+        columns: List[int] = []
+        raw_timestamps: List[Any] = []
 
         for event in events:
             user_id = event.get("user_id")
-            if user_id not in cohort.user_ids:
+            if user_id not in members:
                 continue
 
-            if user_id not in user_journeys:
-                user_journeys[user_id] = OnboardingJourney(
-                    user_id=user_id,
-                    started_at=datetime.fromisoformat(event["timestamp"]),
-                )
+            column = _EVENT_STAGE_CODES.get(event.get("event_name", ""))
+            if column is None:
+                continue
+
+            rows.append(user_rows.setdefault(user_id, len(user_rows)))
+            columns.append(column)
+            raw_timestamps.append(event["timestamp"])
+
+        # Users x stages matrix of stage entry times (microseconds)
+        ts = _stage_timestamp_matrix(
+            rows,
+            columns,
+            _parse_timestamps(raw_timestamps),
+            len(user_rows),
+            len(FunnelStage),
+        )
+        return list(user_rows), ts
+
+    def analyze_cohort_columns(
+        self,
+        cohort_id: str,
+        user_ids: Any,
+        event_names: Any,
+        timestamps: Any,
+    ) -> OnboardingCohort:
+        """
+        Analyze a cohort from columnar event data.
+
+        Equivalent to ``analyze_cohort`` for events given as parallel
+        arrays (e.g. columns of a query result), but filtering, stage
+        mapping and pivoting are all array operations, with no per-event
+        Python work.
+
+        Args:
+            cohort_id: Cohort to analyze
+            user_ids: User ID per event
+            event_names: Event name per event
+            timestamps: ISO-8601 strings or datetime64 values per event
+
+        Returns:
+            Updated OnboardingCohort with metrics
+        """
+        cohort = self.cohorts.get(cohort_id)
+        if not cohort:
+            raise ValueError(f"Cohort {cohort_id} not found")
+
+        users = np.asarray(user_ids)
+        names = np.asarray(event_names)
+        stage_codes = np.full(names.shape, -1, dtype=np.int64)
+        for name, code in _EVENT_STAGE_CODES.items():
+            stage_codes[names == name] = code
+
+        keep = (stage_codes >= 0) & np.isin(users, cohort.user_ids)
+        kept_timestamps = np.asarray(timestamps)[keep]
+        if np.issubdtype(kept_timestamps.dtype, np.datetime64):
+            parsed = kept_timestamps.astype("datetime64[us]").astype(np.int64)
+        else:
+            parsed = _parse_timestamps(kept_timestamps.tolist())
+
+        row_users, rows = np.unique(users[keep], return_inverse=True)
+        ts = _stage_timestamp_matrix(
+            rows, stage_codes[keep], parsed, row_users.size, len(FunnelStage)
+        )
+        return self._apply_stage_matrix(cohort, row_users.tolist(), ts)
 
-            journey = user_journeys[user_id]
-            self._process_event(journey, event)
-
-        # Compute stage metrics
-        stage_times: Dict[FunnelStage, List[float]] = {s: [] for s in self.STAGE_ORDER}
-
-        for journey in user_journeys.values():
-            for i, stage in enumerate(self.STAGE_ORDER):
-                if stage in journey.stage_timestamps:
-                    cohort.stage_metrics[stage].entered_count += 1
-                    cohort.stage_metrics[stage].completed_count += 1
-
-                    # Compute time in stage
-                    if i > 0:
-                        prev_stage = self.STAGE_ORDER[i - 1]
-                        if prev_stage in journey.stage_timestamps:
-                            time_in_stage = (
-                                journey.stage_timestamps[stage] -
-                                journey.stage_timestamps[prev_stage]
-                            ).total_seconds()
-                            stage_times[stage].append(time_in_stage)
-                else:
-                    # User dropped before this stage
-                    if i > 0 and self.STAGE_ORDER[i - 1] in journey.stage_timestamps:
-                        cohort.stage_metrics[stage].dropped_count += 1
-                    break
-
-        # Compute time percentiles
-        for stage, times in stage_times.items():
-            if times:
-                sorted_times = sorted(times)
-                cohort.stage_metrics[stage].median_time_seconds = statistics.median(times)
-                p90_idx = int(len(sorted_times) * 0.9)
-                cohort.stage_metrics[stage].p90_time_seconds = sorted_times[p90_idx]
+    def _apply_stage_matrix(
+        self,
+        cohort: OnboardingCohort,
+        user_ids: List[str],
+        ts: np.ndarray,
+    ) -> OnboardingCohort:
+        """
+        Merge a users x stages timestamp matrix into the cohort's stored one
+        and rebuild the cohort's metrics from the result.
+        """
+        cohort._stage_user_ids, cohort._stage_ts = self._merge_stage_matrix(
+            cohort, user_ids, ts
+        )
+        reached, dropped, median, p90, stage_times = _funnel_kernel(cohort._stage_ts)
+
+        # Compute stage metrics and time percentiles
+        for stage in self.STAGE_ORDER:
+            i = stage.code
+            metrics = cohort.stage_metrics[stage] = FunnelMetrics(stage=stage)
+            metrics.entered_count = int(reached[i])
+            metrics.completed_count = int(reached[i])
+            metrics.dropped_count = int(dropped[i])
+            metrics.time_sketch.update_batch(stage_times[i])
+            if not np.isnan(median[i]):
+                metrics.median_time_seconds = float(median[i])
+                metrics.p90_time_seconds = float(p90[i])
 
         # Compute conversion rates
         for stage in self.STAGE_ORDER:
             cohort.stage_metrics[stage].compute_conversion()
 
+        cohort.version += 1
         return cohort
 
     def _process_event(
@@ -246,17 +649,7 @@ class OnboardingFunnelAnalyzer:
         event_name = event.get("event_name", "")
         timestamp = datetime.fromisoformat(event["timestamp"])
 
-        # Map event names to stages
-        stage_map = {
-            "onboarding_started": FunnelStage.SIGNUP,
-            "profile_completed": FunnelStage.PROFILE_COMPLETE,
-            "workspace_created": FunnelStage.WORKSPACE_CREATED,
-            "first_task_created": FunnelStage.FIRST_TASK,
-            "tutorial_completed": FunnelStage.TUTORIAL_COMPLETE,
-            "onboarding_completed": FunnelStage.ACTIVATED,
-        }
-
-        stage = stage_map.get(event_name)
+        stage = _EVENT_STAGES.get(event_name)
         if stage:
             journey.stage_timestamps[stage] = timestamp
             journey.current_stage = stage
@@ -267,8 +660,7 @@ class OnboardingFunnelAnalyzer:
 
         # Track interactions
         if journey.current_stage:
-            current = journey.interactions_per_stage.get(journey.current_stage, 0)
-            journey.interactions_per_stage[journey.current_stage] = current + 1
+            journey.interactions_per_stage[journey.current_stage.code] += 1
 
     def identify_drop_offs(
         self,
@@ -291,11 +683,10 @@ class OnboardingFunnelAnalyzer:
 
         drop_offs = []
 
-        for i, stage in enumerate(self.STAGE_ORDER[1:], 1):
-            prev_stage = self.STAGE_ORDER[i - 1]
-            prev_metrics = cohort.stage_metrics[prev_stage]
-            curr_metrics = cohort.stage_metrics[stage]
+        stage_metrics = [cohort.stage_metrics[stage] for stage in self.STAGE_ORDER]
 
+        for prev_metrics, curr_metrics in zip(stage_metrics, stage_metrics[1:]):
+            stage = curr_metrics.stage
             if prev_metrics.completed_count > 0:
                 drop_off_rate = 1.0 - (
                     curr_metrics.completed_count / prev_metrics.completed_count
@@ -325,19 +716,26 @@ class OnboardingFunnelAnalyzer:
         Returns:
             Dict mapping cohort_id to stage conversion rates
         """
-        comparison = {}
-
-        for cohort_id in cohort_ids:
-            cohort = self.cohorts.get(cohort_id)
-            if not cohort:
-                continue
+        # Each lookup is a cached dict read, so this stays sequential: a
+        # thread pool's startup alone costs ~100x the whole comparison
+        return {
+            cohort_id: self._conversion_rates(cohort)
+            for cohort_id in cohort_ids
+            if (cohort := self.cohorts.get(cohort_id)) is not None
+        }
 
-            comparison[cohort_id] = {
-                stage: metrics.conversion_rate
-                for stage, metrics in cohort.stage_metrics.items()
-            }
+    def _conversion_rates(self, cohort: OnboardingCohort) -> Dict[FunnelStage, float]:
+        """Stage conversion rates, cached until the cohort's version changes."""
+        cached = cohort._rates_cache
+        if cached is not None and cached[0] == cohort.version:
+            return cached[1]
 
-        return comparison
+        rates = {
+            stage: metrics.conversion_rate
+            for stage, metrics in cohort.stage_metrics.items()
+        }
+        cohort._rates_cache = (cohort.version, rates)
+        return rates
 
     def get_funnel_summary(
         self,
@@ -346,6 +744,9 @@ class OnboardingFunnelAnalyzer:
         """
         Get a summary of funnel performance.
 
+        Summaries are cached per cohort version, so repeated polling is a
+        lookup. The returned dict is shared; treat it as read-only.
+
         Args:
             cohort_id: Cohort to summarize
 
@@ -356,22 +757,18 @@ class OnboardingFunnelAnalyzer:
         if not cohort:
             raise ValueError(f"Cohort {cohort_id} not found")
 
-        # Find the biggest drop-off
-        max_drop_stage = None
-        max_drop_rate = 0.0
-
-        for i, stage in enumerate(self.STAGE_ORDER[1:], 1):
-            prev_stage = self.STAGE_ORDER[i - 1]
-            prev_count = cohort.stage_metrics[prev_stage].completed_count
-            curr_count = cohort.stage_metrics[stage].completed_count
+        cached = cohort._summary_cache
+        if cached is not None and cached[0] == cohort.version:
+            return cached[1]
 
-            if prev_count > 0:
-                drop_rate = 1.0 - (curr_count / prev_count)
-                if drop_rate > max_drop_rate:
-                    max_drop_rate = drop_rate
-                    max_drop_stage = stage
+        # Find the biggest drop-off
+        completed = np.array(
+            [cohort.stage_metrics[stage].completed_count for stage in self.STAGE_ORDER]
+        )
+        drop_index, max_drop_rate = _biggest_drop_off(completed)
+        max_drop_stage = self.STAGE_ORDER[drop_index] if drop_index is not None else None
 
-        return {
+        summary = {
             "cohort_id": cohort_id,
             "cohort_size": cohort.size,
             "date_range": {
@@ -393,6 +790,8 @@ class OnboardingFunnelAnalyzer:
                 for stage, metrics in cohort.stage_metrics.items()
             },
         }
+        cohort._summary_cache = (cohort.version, summary)
+        return summary
 
     def calculate_time_to_value(
         self,
@@ -409,22 +808,66 @@ class OnboardingFunnelAnalyzer:
         Returns:
             Dict with time metrics (median, p75, p90)
         """
-        times = []
-
-        for journey in journeys:
-            if value_stage in journey.stage_timestamps:
-                time_to_value = (
-                    journey.stage_timestamps[value_stage] - journey.started_at
-                ).total_seconds()
-                times.append(time_to_value)
+        # Subtracting datetimes in Python beats converting them to datetime64,
+        # so only the collection and the percentile selection go through numpy
+        times = np.fromiter(
+            (
+                (reached_at - journey.started_at).total_seconds()
+                for journey in journeys
+                if (reached_at := journey.stage_timestamps.get(value_stage)) is not None
+            ),
+            dtype=np.float64,
+        )
 
-        if not times:
+        if not times.size:
             return {"median": 0, "p75": 0, "p90": 0, "count": 0}
 
-        sorted_times = sorted(times)
+        median, p75, p90 = _percentiles(times)
         return {
-            "median": statistics.median(times),
-            "p75": sorted_times[int(len(sorted_times) * 0.75)],
-            "p90": sorted_times[int(len(sorted_times) * 0.90)],
-            "count": len(times),
+            "median": median,
+            "p75": p75,
+            "p90": p90,
+            "count": int(times.size),
+        }
+
+    def export_stage_events(self, path: str) -> int:
+        """
+        Write every cohort's analyzed stage events to a columnar .npz file.
+
+        The table is long-format with one row per (cohort, user, stage)
+        entry time: ``cohort_code`` (int32, indexing ``cohort_ids``),
+        ``user_id`` (str), ``stage`` (int8 stage code) and ``ts_us``
+        (int64 epoch microseconds). Load it with ``np.load(path)``.
+
+        Args:
+            path: Destination file (``.npz`` is appended by numpy if missing)
+
+        Returns:
+            Number of rows written
+        """
+        cohort_ids = list(self.cohorts)
+        cohort_codes = []
+        user_ids = []
+        stages = []
+        ts_us = []
+
+        for code, cohort_id in enumerate(cohort_ids):
+            cohort = self.cohorts[cohort_id]
+            rows, stage_codes = np.nonzero(cohort._stage_ts != _MISSING_TS)
+            cohort_codes.append(np.full(rows.size, code, dtype=np.int32))
+            user_ids.append(np.asarray(cohort._stage_user_ids, dtype=str)[rows])
+            stages.append(stage_codes.astype(np.int8))
+            ts_us.append(cohort._stage_ts[rows, stage_codes])
+
+        def concat(parts: List[np.ndarray], dtype: Any) -> np.ndarray:
+            return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+        table = {
+            "cohort_ids": np.asarray(cohort_ids, dtype=str),
+            "cohort_code": concat(cohort_codes, np.int32),
+            "user_id": concat(user_ids, str),
+            "stage": concat(stages, np.int8),
+            "ts_us": concat(ts_us, np.int64),
         }
+        np.savez_compressed(path, **table)
+        return int(table["ts_us"].size)
@@ -1,12 +1,35 @@
 """Configuration settings for the AI service."""
 
+import os
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
 from typing import Literal
 
-from pydantic_settings import BaseSettings
+from dotenv import dotenv_values
 
+LLM_PROVIDERS = ("anthropic", "openai")
 
-class Settings(BaseSettings):
+
+def _parse_origins(cors_origins: str) -> tuple[str, ...]:
+    """
+    Split a comma-separated CORS origin list, failing fast on bad entries.
+
+    Blank entries (e.g. from a trailing comma) are ignored. Anything other
+    than "*" must be a scheme://host[:port] origin, since a bare host or a
+    path never matches the browser's Origin header.
+    """
+    origins = tuple(origin.strip() for origin in cors_origins.split(",") if origin.strip())
+    for origin in origins:
+        if origin == "*":
+            continue
+        scheme, sep, rest = origin.partition("://")
+        if not sep or not scheme or not rest or "/" in rest:
+            raise ValueError(f"Invalid CORS origin {origin!r}; expected e.g. https://example.com")
+    return origins
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings loaded from environment variables."""
 
     # LLM Provider
@@ -28,17 +51,52 @@ class Settings(BaseSettings):
     rate_limit_requests: int = 100
     rate_limit_window: int = 60  # seconds
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # Derived at construction
+    cors_origins_list: tuple[str, ...] = field(init=False)
+    api_key_bytes: bytes = field(init=False, repr=False)  # For constant-time comparison
+
+    def __post_init__(self) -> None:
+        if self.llm_provider not in LLM_PROVIDERS:
+            raise ValueError(
+                f"llm_provider must be one of {', '.join(LLM_PROVIDERS)}, "
+                f"got {self.llm_provider!r}"
+            )
+        object.__setattr__(self, "cors_origins_list", _parse_origins(self.cors_origins))
+        object.__setattr__(self, "api_key_bytes", self.api_key.encode())
+
+    @classmethod
+    def from_env(cls, env_file: str | None = ".env") -> "Settings":
+        """
+        Build settings from the environment.
+
+        Variables are matched by upper-cased field name. Values set in the
+        process environment take precedence over those in env_file.
+        """
+        values = {
+            key.upper(): value
+            for key, value in (dotenv_values(env_file) if env_file else {}).items()
+            if value is not None
+        }
+        values.update((key.upper(), value) for key, value in os.environ.items())
 
-    @property
-    def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins into a list."""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+        kwargs: dict[str, str | int] = {}
+        for settings_field in fields(cls):
+            raw = values.get(settings_field.name.upper())
+            if not settings_field.init or raw is None:
+                continue
+            if settings_field.type is int:
+                try:
+                    kwargs[settings_field.name] = int(raw)
+                except ValueError:
+                    raise ValueError(
+                        f"{settings_field.name.upper()} must be an integer, got {raw!r}"
+                    ) from None
+            else:
+                kwargs[settings_field.name] = raw
+        return cls(**kwargs)
 
 
 @lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    return Settings.from_env()
@@ -1,5 +1,7 @@
 """Main FastAPI application for ScholarOS AI service."""
 
+import hmac
+
 from fastapi import Depends, FastAPI, HTTPException, Request, Security
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import APIKeyHeader
@@ -20,7 +22,8 @@ async def verify_api_key(
     if not settings.api_key:
         return
 
-    if api_key != settings.api_key:
+    # Constant-time comparison, so response timing doesn't leak the key
+    if not hmac.compare_digest((api_key or "").encode(), settings.api_key_bytes):
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
 
 
@@ -44,36 +47,12 @@ app.add_middleware(
 )
 
 # Include routers with API key dependency
-app.include_router(
-    extract.router,
-    prefix="/api",
-    dependencies=[Depends(verify_api_key)],
-)
-app.include_router(
-    summarize.router,
-    prefix="/api",
-    dependencies=[Depends(verify_api_key)],
-)
-app.include_router(
-    grants.router,
-    prefix="/api",
-    dependencies=[Depends(verify_api_key)],
-)
-app.include_router(
-    documents.router,
-    prefix="/api",
-    dependencies=[Depends(verify_api_key)],
-)
-app.include_router(
-    agents.router,
-    prefix="/api",
-    dependencies=[Depends(verify_api_key)],
-)
-app.include_router(
-    analytics.router,
-    prefix="/api",
-    dependencies=[Depends(verify_api_key)],
-)
+for module in (extract, summarize, grants, documents, agents, analytics):
+    app.include_router(
+        module.router,
+        prefix="/api",
+        dependencies=[Depends(verify_api_key)],
+    )
 
 
 @app.get("/")
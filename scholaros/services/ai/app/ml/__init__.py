@@ -10,11 +10,9 @@ This module provides ML models and services for:
 
 from app.ml.models.onboarding_predictor import OnboardingCompletionPredictor
 from app.ml.models.search_ranker import SearchRanker, SearchRankingFeatures
-from app.ml.services.recommendation_engine import RecommendationEngine
 
 __all__ = [
     "OnboardingCompletionPredictor",
     "SearchRanker",
     "SearchRankingFeatures",
-    "RecommendationEngine",
 ]
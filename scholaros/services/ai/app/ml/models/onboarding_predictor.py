@@ -12,12 +12,13 @@ Model Type: Binary Classification (Logistic Regression baseline, XGBoost for pro
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
-from datetime import datetime, timedelta
+from scipy import special
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for the prediction model."""
     name: str = "onboarding_completion_predictor"
@@ -29,7 +30,7 @@ class ModelConfig:
     random_state: int = 42
 
 
-@dataclass
+@dataclass(slots=True)
 class FeatureDefinition:
     """Definition for a single feature."""
     name: str
@@ -114,7 +115,126 @@ FEATURES: List[FeatureDefinition] = [
 ]
 
 
-@dataclass
+# User attributes read by the rule-based model, with defaults for numeric ones
+_BOOLEAN_ATTRIBUTES = ("started_onboarding", "has_full_name", "has_institution", "is_invited_user")
+_NUMERIC_ATTRIBUTES: Dict[str, float] = {
+    "max_step_reached_day_1": 0,
+    "minutes_to_first_action": 60,
+    "profile_completeness_score": 0,
+}
+
+# Order of the vector returned by prepare_features
+PREPARED_FEATURE_NAMES = (
+    "signup_hour",
+    "minutes_to_first_action",
+    "max_step_reached_day_1",
+    "profile_completeness_score",
+    "started_onboarding",
+    "has_full_name",
+    "has_institution",
+    "is_invited_user",
+    "signup_dow_sin",
+    "signup_dow_cos",
+)
+
+# Cyclic day-of-week encodings, indexed by signup_day_of_week
+_DOW_SIN = np.sin(2 * np.pi * np.arange(7) / 7)
+_DOW_COS = np.cos(2 * np.pi * np.arange(7) / 7)
+
+# Indexed by np.digitize(probability, (0.3, 0.7))
+_RISK_CATEGORIES = np.array(["high_risk", "medium_risk", "low_risk"])
+
+
+def _fit_logistic(
+    features: np.ndarray,
+    y: np.ndarray,
+    l2: float = 1.0,
+    max_iter: int = 100,
+    tol: float = 1e-8,
+) -> np.ndarray:
+    """
+    Fit an L2-regularized logistic regression by Newton's method.
+
+    Args:
+        features: (samples x features) standardized feature matrix
+        y: 0/1 labels
+        l2: Penalty on the coefficients (the intercept is not penalized)
+
+    Returns:
+        Coefficients, intercept first
+    """
+    design = np.hstack([np.ones((len(features), 1)), features])
+    penalty = np.full(design.shape[1], l2)
+    penalty[0] = 0.0
+    coef = np.zeros(design.shape[1])
+
+    for _ in range(max_iter):
+        p = special.expit(design @ coef)
+        gradient = design.T @ (p - y) + penalty * coef
+        hessian = (design.T * (p * (1 - p))) @ design + np.diag(penalty)
+        step = np.linalg.lstsq(hessian, gradient, rcond=None)[0]
+        coef -= step
+        if np.abs(step).max() < tol:
+            break
+
+    return coef
+
+
+def _rule_based_scores(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Rule-based completion probabilities for a batch of users.
+
+    Each rule adds into one score buffer in place (masked adds for the
+    boolean rules), so no per-rule temporaries are allocated.
+    """
+    score = np.full(len(columns["started_onboarding"]), 0.3)  # Base probability
+
+    # Apply weights
+    np.add(score, 0.25, out=score, where=columns["started_onboarding"])
+    score += columns["max_step_reached_day_1"] * 0.08  # Each step adds 8%
+    np.add(score, 0.1, out=score, where=columns["has_full_name"])
+    np.add(score, 0.05, out=score, where=columns["has_institution"])
+
+    # Time to first action penalty
+    minutes = columns["minutes_to_first_action"]
+    np.add(score, -0.1, out=score, where=minutes > 60)
+    np.add(score, 0.05, out=score, where=minutes < 5)
+
+    # Invited users more likely to complete
+    np.add(score, 0.1, out=score, where=columns["is_invited_user"])
+
+    return np.clip(score, 0.05, 0.95, out=score)
+
+
+@lru_cache(maxsize=4096)
+def _cached_rule_score(
+    started: bool,
+    step: float,
+    has_full_name: bool,
+    has_institution: bool,
+    minutes: float,
+    invited: bool,
+) -> float:
+    """
+    Rule-based probability for one user state; see predict_rule_based.
+
+    The cache is process-global and shared by every predictor, whatever its
+    model version. That is safe because the rules are fixed in
+    _rule_based_scores and read nothing from ModelConfig or the trained
+    model; clear it with _cached_rule_score.cache_clear() if they change.
+    """
+    columns = {
+        "started_onboarding": np.array([started]),
+        "max_step_reached_day_1": np.array([step]),
+        "has_full_name": np.array([has_full_name]),
+        "has_institution": np.array([has_institution]),
+        "minutes_to_first_action": np.array([minutes]),
+        "is_invited_user": np.array([invited]),
+    }
+    return _rule_based_scores(columns).item()
+
+
+@dataclass(slots=True)
 class OnboardingIntervention:
     """Recommended intervention for at-risk users."""
     action: str
@@ -122,7 +242,7 @@ class OnboardingIntervention:
     priority: str  # "high", "medium", "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class PredictionResult:
     """Result of a prediction."""
     user_id: str
@@ -145,8 +265,10 @@ class OnboardingCompletionPredictor:
 
     def __init__(self, config: Optional[ModelConfig] = None):
         self.config = config or ModelConfig()
-        self.model = None
-        self.scaler = None
+        self.model: Optional[np.ndarray] = None  # Logistic coefficients, intercept first
+        self.scaler: Optional[Tuple[np.ndarray, np.ndarray]] = None  # Feature (mean, std)
+        # Coefficients with the scaler folded in, applied to raw features
+        self._raw_coef: Optional[np.ndarray] = None
         self.feature_names = [f.name for f in FEATURES]
         self._is_trained = False
 
@@ -159,8 +281,21 @@ class OnboardingCompletionPredictor:
             "minutes_to_first_action": -0.1,
             "max_step_reached_day_1": 0.2,
         }
+        # Ranked once; get_feature_importance hands out copies
+        self._feature_importance = tuple(
+            {
+                "feature": name,
+                "importance": abs(weight),
+                "direction": "positive" if weight > 0 else "negative",
+            }
+            for name, weight in sorted(
+                self._default_weights.items(),
+                key=lambda x: abs(x[1]),
+                reverse=True
+            )
+        )
 
-    def prepare_features(self, user_data: Dict[str, Any]) -> Dict[str, float]:
+    def prepare_features(self, user_data: Dict[str, Any]) -> np.ndarray:
         """
         Prepare feature vector from user data.
 
@@ -168,30 +303,30 @@ class OnboardingCompletionPredictor:
             user_data: Dictionary containing user attributes
 
         Returns:
-            Dictionary of feature name to normalized value
+            Array of normalized values, ordered as PREPARED_FEATURE_NAMES
         """
-        features = {}
-
-        # Numeric features
-        features["signup_hour"] = user_data.get("signup_hour", 12) / 24.0
-        features["minutes_to_first_action"] = min(
-            user_data.get("minutes_to_first_action", 60) / 60.0, 10.0
-        ) / 10.0
-        features["max_step_reached_day_1"] = user_data.get("max_step_reached_day_1", 0) / 5.0
-        features["profile_completeness_score"] = user_data.get("profile_completeness_score", 0) / 4.0
-
-        # Boolean features
-        features["started_onboarding"] = 1.0 if user_data.get("started_onboarding") else 0.0
-        features["has_full_name"] = 1.0 if user_data.get("has_full_name") else 0.0
-        features["has_institution"] = 1.0 if user_data.get("has_institution") else 0.0
-        features["is_invited_user"] = 1.0 if user_data.get("is_invited_user") else 0.0
-
-        # Categorical features (simplified - day of week as cyclic)
-        dow = user_data.get("signup_day_of_week", 1)
-        features["signup_dow_sin"] = np.sin(2 * np.pi * dow / 7)
-        features["signup_dow_cos"] = np.cos(2 * np.pi * dow / 7)
-
-        return features
+        get = user_data.get
+        dow = get("signup_day_of_week", 1)
+        if type(dow) is int and 0 <= dow < 7:
+            dow_sin, dow_cos = _DOW_SIN[dow], _DOW_COS[dow]
+        else:
+            dow_sin, dow_cos = np.sin(2 * np.pi * dow / 7), np.cos(2 * np.pi * dow / 7)
+
+        return np.array([
+            # Numeric features
+            get("signup_hour", 12) / 24.0,
+            min(get("minutes_to_first_action", 60) / 60.0, 10.0) / 10.0,
+            get("max_step_reached_day_1", 0) / 5.0,
+            get("profile_completeness_score", 0) / 4.0,
+            # Boolean features
+            1.0 if get("started_onboarding") else 0.0,
+            1.0 if get("has_full_name") else 0.0,
+            1.0 if get("has_institution") else 0.0,
+            1.0 if get("is_invited_user") else 0.0,
+            # Categorical features (simplified - day of week as cyclic)
+            dow_sin,
+            dow_cos,
+        ])
 
     def predict_rule_based(self, user_data: Dict[str, Any]) -> float:
         """
@@ -203,32 +338,24 @@ class OnboardingCompletionPredictor:
         Returns:
             Probability of completion (0-1)
         """
-        score = 0.3  # Base probability
-
-        # Apply weights
-        if user_data.get("started_onboarding"):
-            score += 0.25
-
-        step_reached = user_data.get("max_step_reached_day_1", 0)
-        score += step_reached * 0.08  # Each step adds 8%
-
-        if user_data.get("has_full_name"):
-            score += 0.1
-        if user_data.get("has_institution"):
-            score += 0.05
-
-        # Time to first action penalty
-        minutes = user_data.get("minutes_to_first_action", 60)
+        get = user_data.get
+        # Only which side of the 5 and 60 minute thresholds matters, so
+        # minutes are snapped to one value per band to keep the cache small
+        minutes = float(get("minutes_to_first_action", 60))
         if minutes > 60:
-            score -= 0.1
+            minutes = 61.0
         elif minutes < 5:
-            score += 0.05
-
-        # Invited users more likely to complete
-        if user_data.get("is_invited_user"):
-            score += 0.1
-
-        return max(0.05, min(0.95, score))
+            minutes = 0.0
+        else:
+            minutes = 60.0
+        return _cached_rule_score(
+            bool(get("started_onboarding")),
+            float(get("max_step_reached_day_1", 0)),
+            bool(get("has_full_name")),
+            bool(get("has_institution")),
+            minutes,
+            bool(get("is_invited_user")),
+        )
 
     def predict(self, user_data: Dict[str, Any]) -> PredictionResult:
         """
@@ -240,88 +367,155 @@ class OnboardingCompletionPredictor:
         Returns:
             PredictionResult with probability and recommendations
         """
-        user_id = user_data.get("user_id", "unknown")
+        return self.predict_batch([user_data])[0]
 
-        # Use rule-based prediction if model not trained
-        if not self._is_trained:
-            probability = self.predict_rule_based(user_data)
+    def predict_batch(self, users: List[Dict[str, Any]]) -> List[PredictionResult]:
+        """
+        Predict completion probabilities for many users at once.
+
+        Scores, risk categories and the risk factor and intervention checks
+        are computed as arrays over all users; PredictionResult objects are
+        only built at the end.
+
+        Args:
+            users: User data dictionaries, each including 'user_id'
+
+        Returns:
+            PredictionResult per user, in input order
+        """
+        columns = self._user_columns(users)
+
+        if self._is_trained:
+            probabilities = self.predict_proba_batch(users)
         else:
-            features = self.prepare_features(user_data)
-            # Would use self.model.predict_proba() here
-            probability = self.predict_rule_based(user_data)
+            probabilities = _rule_based_scores(columns)
 
         # Determine risk category
-        if probability < 0.3:
-            risk_category = "high_risk"
-        elif probability < 0.7:
-            risk_category = "medium_risk"
-        else:
-            risk_category = "low_risk"
+        risk_categories = _RISK_CATEGORIES[np.digitize(probabilities, (0.3, 0.7))]
+
+        started = columns["started_onboarding"]
+        minutes = columns["minutes_to_first_action"]
+        step = columns["max_step_reached_day_1"]
+        slow = minutes > 60
+        risk_masks = np.stack([
+            ~started,
+            slow,
+            ~columns["has_full_name"],
+            step < 2,
+        ], axis=1).tolist()
+        intervention_masks = np.stack([
+            ~started,
+            columns["profile_completeness_score"] < 2,
+            slow,
+            (step > 0) & (step < 5),
+        ], axis=1).tolist()
 
-        # Identify risk factors
-        risk_factors = self._identify_risk_factors(user_data)
+        return [
+            PredictionResult(
+                user_id=user_data.get("user_id", "unknown"),
+                completion_probability=probability,
+                risk_category=risk_category,
+                top_risk_factors=self._risk_factors(user_data, risks),
+                recommended_interventions=self._interventions(
+                    user_data, risk_category, needs
+                ),
+            )
+            for user_data, probability, risk_category, risks, needs in zip(
+                users,
+                probabilities.tolist(),
+                risk_categories.tolist(),
+                risk_masks,
+                intervention_masks,
+            )
+        ]
 
-        # Generate interventions
-        interventions = self._get_interventions(user_data, risk_category)
+    def predict_proba_batch(self, users: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Completion probabilities for many users from the trained model.
 
-        return PredictionResult(
-            user_id=user_id,
-            completion_probability=probability,
-            risk_category=risk_category,
-            top_risk_factors=risk_factors,
-            recommended_interventions=interventions,
-        )
+        Falls back to the rule-based scores before the model is trained.
+
+        Args:
+            users: User data dictionaries
 
-    def _identify_risk_factors(self, user_data: Dict[str, Any]) -> List[str]:
-        """Identify top risk factors for non-completion."""
+        Returns:
+            Array of probabilities, in input order
+        """
+        if not self._is_trained:
+            return _rule_based_scores(self._user_columns(users))
+
+        return special.expit(self._raw_coef[0] + self._feature_matrix(users) @ self._raw_coef[1:])
+
+    def _feature_matrix(self, users: List[Dict[str, Any]]) -> np.ndarray:
+        """prepare_features for each user, stacked into a (users x features) matrix."""
+        matrix = np.empty((len(users), len(PREPARED_FEATURE_NAMES)))
+        for i, user_data in enumerate(users):
+            matrix[i] = self.prepare_features(user_data)
+        return matrix
+
+    def _user_columns(self, users: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Gather the attributes the rules use into one array per attribute."""
+        n = len(users)
+        columns = {
+            name: np.fromiter((bool(u.get(name)) for u in users), dtype=bool, count=n)
+            for name in _BOOLEAN_ATTRIBUTES
+        }
+        for name, default in _NUMERIC_ATTRIBUTES.items():
+            columns[name] = np.fromiter(
+                (u.get(name, default) for u in users), dtype=np.float64, count=n
+            )
+        return columns
+
+    def _risk_factors(self, user_data: Dict[str, Any], risks: List[bool]) -> List[str]:
+        """Top risk factors for non-completion, given the user's risk checks."""
+        not_started, slow, no_name, low_progress = risks
         risk_factors = []
 
-        if not user_data.get("started_onboarding"):
+        if not_started:
             risk_factors.append("Has not started onboarding")
-
-        if user_data.get("minutes_to_first_action", 60) > 60:
+        if slow:
             risk_factors.append("Slow to take first action (>1 hour)")
-
-        if not user_data.get("has_full_name"):
+        if no_name:
             risk_factors.append("Profile incomplete (no name)")
-
-        step = user_data.get("max_step_reached_day_1", 0)
-        if step < 2:
+        if low_progress:
+            step = user_data.get("max_step_reached_day_1", 0)
             risk_factors.append(f"Low progress (step {step}/5)")
 
         return risk_factors[:3]  # Top 3 factors
 
-    def _get_interventions(
+    def _interventions(
         self,
         user_data: Dict[str, Any],
-        risk_category: str
+        risk_category: str,
+        needs: List[bool],
     ) -> List[OnboardingIntervention]:
-        """Generate recommended interventions based on user state."""
+        """Recommended interventions, given the user's intervention checks."""
+        not_started, thin_profile, slow, stalled = needs
         interventions = []
 
-        if not user_data.get("started_onboarding"):
+        if not_started:
             interventions.append(OnboardingIntervention(
                 action="nudge_start_onboarding",
                 message="Send reminder email to start onboarding",
                 priority="high",
             ))
 
-        if user_data.get("profile_completeness_score", 0) < 2:
+        if thin_profile:
             interventions.append(OnboardingIntervention(
                 action="encourage_profile_completion",
                 message="Highlight benefits of completing profile",
                 priority="medium",
             ))
 
-        if user_data.get("minutes_to_first_action", 60) > 60:
+        if slow:
             interventions.append(OnboardingIntervention(
                 action="quick_win_suggestion",
                 message="Send quick-start guide email",
                 priority="high" if risk_category == "high_risk" else "medium",
             ))
 
-        step = user_data.get("max_step_reached_day_1", 0)
-        if step > 0 and step < 5:
+        if stalled:
+            step = user_data.get("max_step_reached_day_1", 0)
             interventions.append(OnboardingIntervention(
                 action="progress_reminder",
                 message=f"Encourage completion (stuck at step {step})",
@@ -346,30 +540,39 @@ class OnboardingCompletionPredictor:
                 "error": f"Insufficient training samples ({len(training_data)} < {self.config.min_training_samples})",
             }
 
-        # In production, would use sklearn or similar
-        # For MVP, just mark as trained and continue using rule-based
+        features = self._feature_matrix(training_data)
+        y = np.fromiter(
+            (bool(d.get("completed")) for d in training_data),
+            dtype=np.float64,
+            count=len(training_data),
+        )
+
+        # Standardize, leaving constant features unscaled
+        mean = features.mean(axis=0)
+        std = features.std(axis=0)
+        std[std == 0] = 1.0
+        scaled = (features - mean) / std
+        self.scaler = (mean, std)
+        self.model = _fit_logistic(scaled, y)
+        # (x - mean) / std . w + b == x . (w / std) + (b - mean . (w / std))
+        weights = self.model[1:] / std
+        self._raw_coef = np.concatenate(([self.model[0] - mean @ weights], weights))
         self._is_trained = True
 
         # Calculate basic metrics from training data
-        completed_count = sum(1 for d in training_data if d.get("completed"))
-        completion_rate = completed_count / len(training_data)
+        completion_rate = float(y.mean())
+        predicted = self.model[0] + scaled @ self.model[1:] >= 0  # probability >= 0.5
 
         return {
             "success": True,
             "n_samples": len(training_data),
             "completion_rate": completion_rate,
-            "model_type": "rule_based",  # Would be "logistic" or "gbm" with sklearn
+            "train_accuracy": float((predicted == y.astype(bool)).mean()),
+            "model_type": "logistic",
             "version": self.config.version,
         }
 
     def get_feature_importance(self) -> List[Dict[str, Any]]:
         """Get feature importance rankings."""
         # For rule-based model, return predefined weights
-        return [
-            {"feature": name, "importance": abs(weight), "direction": "positive" if weight > 0 else "negative"}
-            for name, weight in sorted(
-                self._default_weights.items(),
-                key=lambda x: abs(x[1]),
-                reverse=True
-            )
-        ]
+        return [dict(entry) for entry in self._feature_importance]
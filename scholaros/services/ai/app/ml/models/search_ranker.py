@@ -7,12 +7,21 @@ MVP: Linear scoring model with manually tuned weights
 Future: Train LambdaMART on click-through data
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Set
-import math
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, FrozenSet, Optional, Set, Tuple
 
+import numpy as np
 
-@dataclass
+
+# Result types with their own id; any other type gets -1
+RESULT_TYPES: Tuple[str, ...] = ("task", "project", "grant", "publication", "navigation")
+TYPE_TO_ID: Dict[str, int] = {result_type: i for i, result_type in enumerate(RESULT_TYPES)}
+
+
+@dataclass(slots=True)
 class SearchRankingFeatures:
     """Features for ranking a single search result."""
     # Query-Document Relevance
@@ -33,15 +42,15 @@ class SearchRankingFeatures:
     # Contextual Signals
     type_matches_context: float = 0.0
 
-    # Result type indicators
-    type_task: float = 0.0
-    type_project: float = 0.0
-    type_grant: float = 0.0
-    type_publication: float = 0.0
-    type_navigation: float = 0.0
+    # Result type, as an index into RESULT_TYPES
+    result_type_id: int = -1
 
 
-@dataclass
+# Column order of the feature matrix built by SearchRanker.rank
+FEATURE_NAMES: Tuple[str, ...] = tuple(f.name for f in fields(SearchRankingFeatures))
+
+
+@dataclass(frozen=True, slots=True)
 class RankingWeights:
     """Weights for the linear ranking model."""
     title_exact_match: float = 5.0
@@ -56,7 +65,7 @@ class RankingWeights:
     days_since_update: float = -0.005
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A search result with its computed score."""
     id: str
@@ -66,6 +75,21 @@ class SearchResult:
     features: Optional[SearchRankingFeatures] = None
     updated_at: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Days since updated_at; set it when already known to skip parsing
+    updated_days_ago: Optional[int] = None
+
+    # Normalized title, derived once at construction
+    title_lower: str = field(init=False, repr=False, compare=False)
+    title_tokens: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    title_word_count: int = field(init=False, repr=False, compare=False)
+    title_ngrams: FrozenSet[str] = field(init=False, repr=False, compare=False)  # Trigrams
+
+    def __post_init__(self) -> None:
+        self.title_lower = self.title.lower()
+        tokens = self.title_lower.split()
+        self.title_tokens = frozenset(tokens)
+        self.title_word_count = len(tokens)
+        self.title_ngrams = _title_trigrams(self.title_lower)
 
 
 @dataclass
@@ -77,6 +101,111 @@ class SearchContext:
     page_context: str = ""  # Current page path
 
 
+def _ngrams(text: str, n: int) -> Set[str]:
+    """Character n-grams of an already lowercased string."""
+    return {text[i:i+n] for i in range(max(0, len(text) - n + 1))}
+
+
+@lru_cache(maxsize=4096)
+def _title_trigrams(title_lower: str) -> FrozenSet[str]:
+    """
+    Character trigrams of a lowercased title, memoized.
+
+    Search-as-you-type re-ranks the same results on every keystroke, so
+    titles recur far more often than queries do.
+    """
+    return frozenset(_ngrams(title_lower, 3))
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two sets, 0 if either is empty."""
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp (a trailing Z is UTC), or None if invalid."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+
+
+def _clocks(now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """
+    The current time as (aware UTC, naive local), from a single clock read.
+
+    Args:
+        now: Timezone-aware current time to use instead of reading the clock
+    """
+    now_utc = now.astimezone(timezone.utc) if now else datetime.now(timezone.utc)
+    return now_utc, now_utc.astimezone().replace(tzinfo=None)
+
+
+def _days_since_update(
+    result: "SearchResult",
+    now_utc: datetime,
+    now_local: datetime,
+) -> Optional[int]:
+    """
+    Whole days since a result was updated, or None if unknown.
+
+    Aware timestamps are compared with now_utc and naive ones with the
+    naive local now_local, both taken once per ranking.
+    """
+    if result.updated_days_ago is not None:
+        return result.updated_days_ago
+    if not result.updated_at:
+        return None
+    updated_at = _parse_timestamp(result.updated_at)
+    if updated_at is None:
+        return None
+    return ((now_utc if updated_at.tzinfo else now_local) - updated_at).days
+
+
+@dataclass
+class _QueryTerms:
+    """A search query lowercased and tokenized once, for scoring many results."""
+    lower: str
+    tokens: FrozenSet[str]
+    ngrams: FrozenSet[str]  # Character trigrams
+
+    @classmethod
+    def from_query(cls, query: str) -> "_QueryTerms":
+        lower = query.lower()
+        return cls(lower, frozenset(lower.split()), frozenset(_ngrams(lower, 3)))
+
+
+@dataclass
+class _HistoryContext:
+    """Personalization signals derived from a user's search history."""
+    selected_ids: Set[str]
+    type_pref: Dict[str, float]  # Share of selections per result type
+    default_pref: float  # For types absent from type_pref
+
+    @classmethod
+    def from_history(cls, user_history: List[Dict[str, Any]]) -> "_HistoryContext":
+        selected_ids = set()
+        type_counts: Dict[str, int] = {}
+        for h in user_history:
+            if not h.get("selected"):
+                continue
+            if h.get("result_id"):
+                selected_ids.add(h["result_id"])
+            if h.get("result_type"):
+                rt = h["result_type"]
+                type_counts[rt] = type_counts.get(rt, 0) + 1
+
+        total_selections = sum(type_counts.values())
+        if total_selections > 0:
+            type_pref = {rt: c / total_selections for rt, c in type_counts.items()}
+            return cls(selected_ids, type_pref, 0.0)
+        return cls(selected_ids, {}, 0.25)  # Default uniform preference
+
+
 # Context type mapping for relevance scoring
 CONTEXT_TYPE_MAP: Dict[str, List[str]] = {
     "/today": ["task"],
@@ -89,6 +218,11 @@ CONTEXT_TYPE_MAP: Dict[str, List[str]] = {
     "/calendar": ["task"],
 }
 
+# (page_context, result_type) pairs from CONTEXT_TYPE_MAP, for one-hash lookups
+CONTEXT_TYPE_PAIRS: FrozenSet[Tuple[str, str]] = frozenset(
+    (page, result_type) for page, types in CONTEXT_TYPE_MAP.items() for result_type in types
+)
+
 
 class SearchRanker:
     """
@@ -100,6 +234,10 @@ class SearchRanker:
 
     def __init__(self, weights: Optional[RankingWeights] = None):
         self.weights = weights or RankingWeights()
+        # Weight per feature column; unweighted features score 0
+        self._weights_vec = np.array(
+            [getattr(self.weights, name, 0.0) for name in FEATURE_NAMES]
+        )
 
     def compute_features(
         self,
@@ -107,6 +245,7 @@ class SearchRanker:
         result: SearchResult,
         user_history: List[Dict[str, Any]],
         context: SearchContext,
+        now: Optional[datetime] = None,
     ) -> SearchRankingFeatures:
         """
         Compute ranking features for a query-result pair.
@@ -116,71 +255,71 @@ class SearchRanker:
             result: Search result to score
             user_history: User's past search selections
             context: Search context (user, workspace, page)
+            now: Timezone-aware current time; pass one in when computing
+                features for many results to read the clock only once
 
         Returns:
             SearchRankingFeatures instance
         """
-        features = SearchRankingFeatures()
-
+        return SearchRankingFeatures(
+            *self._feature_row(
+                _QueryTerms.from_query(query),
+                result,
+                _days_since_update(result, *_clocks(now)),
+                _HistoryContext.from_history(user_history),
+                context,
+            )
+        )
+
+    def _feature_row(
+        self,
+        query: _QueryTerms,
+        result: SearchResult,
+        days_ago: Optional[int],
+        history: _HistoryContext,
+        context: SearchContext,
+    ) -> Tuple[Any, ...]:
+        """Compute a query-result pair's features as a tuple in FEATURE_NAMES order."""
         # Query-Document Relevance
-        query_lower = query.lower()
-        title_lower = result.title.lower()
-
-        features.title_exact_match = 1.0 if query_lower in title_lower else 0.0
-        features.title_token_overlap = self._compute_token_overlap(query, result.title)
-        features.char_ngram_similarity = self._compute_ngram_similarity(query, result.title)
-        features.title_length = len(result.title)
-        features.title_word_count = len(result.title.split())
+        title_exact_match = 1.0 if query.lower in result.title_lower else 0.0
+        title_token_overlap = _jaccard(query.tokens, result.title_tokens)
+        char_ngram_similarity = _jaccard(query.ngrams, result.title_ngrams)
+        # Both are O(1) reads: the split behind the word count happens once,
+        # when the SearchResult is built. The word count is unweighted and
+        # kept only for callers that inspect features.
+        title_length = len(result.title)
+        title_word_count = result.title_word_count
 
         # User Personalization
-        selected_ids = {
-            h.get("result_id")
-            for h in user_history
-            if h.get("selected") and h.get("result_id")
-        }
-        features.user_previously_selected = 1.0 if result.id in selected_ids else 0.0
-
-        # Type preference from history
-        type_counts: Dict[str, int] = {}
-        for h in user_history:
-            if h.get("selected") and h.get("result_type"):
-                rt = h["result_type"]
-                type_counts[rt] = type_counts.get(rt, 0) + 1
-
-        total_selections = sum(type_counts.values())
-        if total_selections > 0:
-            features.user_type_preference = type_counts.get(result.result_type, 0) / total_selections
-        else:
-            features.user_type_preference = 0.25  # Default uniform preference
+        user_previously_selected = 1.0 if result.id in history.selected_ids else 0.0
+        user_type_preference = history.type_pref.get(result.result_type, history.default_pref)
 
         # Temporal Signals
-        if result.updated_at:
-            try:
-                from datetime import datetime
-                updated_at = datetime.fromisoformat(result.updated_at.replace("Z", "+00:00"))
-                now = datetime.now(updated_at.tzinfo) if updated_at.tzinfo else datetime.now()
-                days_ago = (now - updated_at).days
-                features.days_since_update = max(0, days_ago)
-                features.updated_this_week = 1.0 if days_ago <= 7 else 0.0
-            except (ValueError, TypeError):
-                features.days_since_update = 365
-                features.updated_this_week = 0.0
+        if days_ago is None:
+            days_since_update = 365
+            updated_this_week = 0.0
         else:
-            features.days_since_update = 365
-            features.updated_this_week = 0.0
+            days_since_update = max(0, days_ago)
+            updated_this_week = 1.0 if days_ago <= 7 else 0.0
 
         # Contextual Signals
-        expected_types = CONTEXT_TYPE_MAP.get(context.page_context, [])
-        features.type_matches_context = 1.0 if result.result_type in expected_types else 0.0
-
-        # Type indicators (one-hot)
-        features.type_task = 1.0 if result.result_type == "task" else 0.0
-        features.type_project = 1.0 if result.result_type == "project" else 0.0
-        features.type_grant = 1.0 if result.result_type == "grant" else 0.0
-        features.type_publication = 1.0 if result.result_type == "publication" else 0.0
-        features.type_navigation = 1.0 if result.result_type == "navigation" else 0.0
-
-        return features
+        type_matches_context = (
+            1.0 if (context.page_context, result.result_type) in CONTEXT_TYPE_PAIRS else 0.0
+        )
+
+        return (
+            title_exact_match,
+            title_token_overlap,
+            char_ngram_similarity,
+            title_length,
+            title_word_count,
+            user_previously_selected,
+            user_type_preference,
+            days_since_update,
+            updated_this_week,
+            type_matches_context,
+            TYPE_TO_ID.get(result.result_type, -1),
+        )
 
     def score(self, features: SearchRankingFeatures) -> float:
         """
@@ -221,58 +360,77 @@ class SearchRanker:
         query: str,
         user_history: List[Dict[str, Any]],
         context: SearchContext,
+        include_features: bool = True,
+        top_k: Optional[int] = None,
     ) -> List[SearchResult]:
         """
         Rank search results by computed scores.
 
+        Features are gathered into one (results x features) matrix and
+        scored with a single matrix-vector product. With top_k, only the
+        results that can make the cut are sorted.
+
         Args:
             results: List of search results to rank
             query: Search query string
             user_history: User's past search selections
             context: Search context
+            include_features: Attach SearchRankingFeatures to each result
+            top_k: Return only the k highest-scoring results
 
         Returns:
             List of SearchResult sorted by score descending
         """
-        scored_results = []
-
-        for result in results:
-            features = self.compute_features(query, result, user_history, context)
-            result.features = features
-            result.score = self.score(features)
-            scored_results.append(result)
-
-        return sorted(scored_results, key=lambda r: r.score, reverse=True)
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"top_k must be positive, got {top_k}")
+
+        terms = _QueryTerms.from_query(query)
+        history = _HistoryContext.from_history(user_history)
+        now_utc, now_local = _clocks()
+        rows = [
+            self._feature_row(
+                terms,
+                result,
+                _days_since_update(result, now_utc, now_local),
+                history,
+                context,
+            )
+            for result in results
+        ]
+        # Filled straight from the flattened rows; the matrix-vector product
+        # itself is negligible next to this, so it stays float64.
+        matrix = np.fromiter(
+            chain.from_iterable(rows), dtype=np.float64, count=len(rows) * len(FEATURE_NAMES)
+        ).reshape(len(rows), len(FEATURE_NAMES))
+        scores = matrix @ self._weights_vec
+
+        for result, row, score in zip(results, rows, scores.tolist()):
+            result.score = score
+            if include_features:
+                result.features = SearchRankingFeatures(*row)
+
+        # Stable, so ties keep their input order
+        if top_k is None or top_k >= len(results):
+            order = np.argsort(-scores, kind="stable")
+        else:
+            # Partition out the k-th best score, then sort only the results at
+            # or above it; taking them in input order keeps ties stable.
+            cutoff = -np.partition(-scores, top_k - 1)[top_k - 1]
+            candidates = np.flatnonzero(scores >= cutoff)
+            order = candidates[np.argsort(-scores[candidates], kind="stable")[:top_k]]
+        return [results[i] for i in order.tolist()]
 
     def _compute_token_overlap(self, s1: str, s2: str) -> float:
         """Compute Jaccard similarity on word tokens."""
-        tokens1 = set(s1.lower().split())
-        tokens2 = set(s2.lower().split())
-
-        if not tokens1 or not tokens2:
-            return 0.0
-
-        intersection = len(tokens1 & tokens2)
-        union = len(tokens1 | tokens2)
-
-        return intersection / union if union > 0 else 0.0
+        return _jaccard(set(s1.lower().split()), set(s2.lower().split()))
 
     def _compute_ngram_similarity(self, s1: str, s2: str, n: int = 3) -> float:
         """Compute character n-gram Jaccard similarity."""
-        def get_ngrams(s: str) -> Set[str]:
-            s = s.lower()
-            return {s[i:i+n] for i in range(max(0, len(s) - n + 1))}
+        return _jaccard(_ngrams(s1.lower(), n), _ngrams(s2.lower(), n))
 
-        ngrams1 = get_ngrams(s1)
-        ngrams2 = get_ngrams(s2)
 
-        if not ngrams1 or not ngrams2:
-            return 0.0
-
-        intersection = len(ngrams1 & ngrams2)
-        union = len(ngrams1 | ngrams2)
-
-        return intersection / union if union > 0 else 0.0
+# DCG position discounts 1 / log2(rank + 1), for ranks up to 1024
+_DCG_DISCOUNTS = 1.0 / np.log2(np.arange(2, 1026))
 
 
 class SearchRankingMetrics:
@@ -332,10 +490,13 @@ class SearchRankingMetrics:
         Returns:
             DCG@k score
         """
-        dcg = 0.0
-        for i, rel in enumerate(relevance_scores[:k]):
-            dcg += (2 ** rel - 1) / math.log2(i + 2)
-        return dcg
+        gains = np.exp2(np.asarray(relevance_scores[:k], dtype=np.float64)) - 1
+        n = len(gains)
+        if n <= len(_DCG_DISCOUNTS):
+            discounts = _DCG_DISCOUNTS[:n]
+        else:
+            discounts = 1.0 / np.log2(np.arange(2, n + 2))
+        return float(gains @ discounts)
 
     @staticmethod
     def ndcg_at_k(relevance_scores: List[float], k: int) -> float:
@@ -351,8 +512,12 @@ class SearchRankingMetrics:
         """
         dcg = SearchRankingMetrics.dcg_at_k(relevance_scores, k)
 
-        # Ideal DCG: sort relevance scores in descending order
-        ideal_scores = sorted(relevance_scores, reverse=True)
+        # Ideal DCG: relevance scores in descending order. Only the top k
+        # count, so partition them out before sorting.
+        scores = np.asarray(relevance_scores, dtype=np.float64)
+        if 0 < k < len(scores):
+            scores = np.partition(scores, len(scores) - k)[len(scores) - k:]
+        ideal_scores = np.sort(scores)[::-1]
         idcg = SearchRankingMetrics.dcg_at_k(ideal_scores, k)
 
         return dcg / idcg if idcg > 0 else 0.0
@@ -1,10 +1,12 @@
 """API routes for multi-agent framework."""
 
+import asyncio
 import logging
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from app.agents.orchestrator import AgentOrchestrator, get_orchestrator
 from app.agents.types import (
@@ -17,32 +19,55 @@ from app.agents.types import (
     FeedbackRequest,
     OrchestrateRequest,
     OrchestrateResponse,
-    WorkingMemory,
+    WorkflowDefinition,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/agents", tags=["agents"])
 
+# Seconds between keep-alive comments while a streamed chat is still running
+_SSE_PING_INTERVAL = 15
+
+# Serializes the error payload of a failed chat stream
+_ERROR_EVENT = TypeAdapter(dict[str, str])
+
 
 # =============================================================================
 # Dependency to get context from request
 # =============================================================================
 
-async def get_context_from_request(
-    workspace_id: str | None = None,
-    user_id: str | None = None,
-    session_id: str | None = None,
+def _build_context(
+    session_id: str | None,
+    workspace_id: str | None,
+    user_id: str | None,
+    request_context: dict[str, Any] | None = None,
 ) -> AgentContext:
-    """Build agent context from request parameters."""
+    """
+    Build a fresh agent context.
+
+    The user's tasks, projects and profile come from request_context when given;
+    AgentContext creates its own empty WorkingMemory.
+    """
+    request_context = request_context or {}
     return AgentContext(
         session_id=session_id or "default",
         workspace_id=workspace_id or "default",
         user_id=user_id or "anonymous",
-        message_count=0,
-        working_memory=WorkingMemory(),
+        user_tasks=request_context.get("tasks", []),
+        user_projects=request_context.get("projects", []),
+        user_profile=request_context.get("profile", {}),
     )
 
 
+async def get_context_from_request(
+    workspace_id: str | None = None,
+    user_id: str | None = None,
+    session_id: str | None = None,
+) -> AgentContext:
+    """Build agent context from request parameters."""
+    return _build_context(session_id, workspace_id, user_id)
+
+
 # =============================================================================
 # Agent Information Endpoints
 # =============================================================================
@@ -69,23 +94,11 @@ async def get_agent_info(
     except ValueError:
         raise HTTPException(status_code=404, detail=f"Unknown agent type: {agent_type}")
 
-    agent = orchestrator.registry.get(agent_type_enum)
-    if not agent:
+    info = orchestrator.registry.get_agent_details(agent_type_enum)
+    if info is None:
         raise HTTPException(status_code=404, detail=f"Agent not found: {agent_type}")
 
-    return {
-        "type": agent.agent_type.value,
-        "name": agent.name,
-        "description": agent.description,
-        "capabilities": [
-            {"name": cap.name, "description": cap.description}
-            for cap in agent.capabilities
-        ],
-        "tools": [
-            {"name": tool.name, "description": tool.description}
-            for tool in agent.tools
-        ],
-    }
+    return info
 
 
 # =============================================================================
@@ -106,17 +119,7 @@ async def chat(
     """
     await orchestrator.initialize()
 
-    context = AgentContext(
-        session_id=request.session_id or "default",
-        workspace_id=workspace_id or "default",
-        user_id=user_id or "anonymous",
-        message_count=0,
-        working_memory=WorkingMemory(),
-        # Additional context from request
-        user_tasks=request.context.get("tasks", []),
-        user_projects=request.context.get("projects", []),
-        user_profile=request.context.get("profile", {}),
-    )
+    context = _build_context(request.session_id, workspace_id, user_id, request.context)
 
     try:
         response = await orchestrator.chat(request, context)
@@ -138,32 +141,33 @@ async def chat_stream(
     """
     await orchestrator.initialize()
 
-    context = AgentContext(
-        session_id=request.session_id or "default",
-        workspace_id=workspace_id or "default",
-        user_id=user_id or "anonymous",
-        message_count=0,
-        working_memory=WorkingMemory(),
-        user_tasks=request.context.get("tasks", []),
-        user_projects=request.context.get("projects", []),
-        user_profile=request.context.get("profile", {}),
-    )
+    context = _build_context(request.session_id, workspace_id, user_id, request.context)
 
     async def generate():
         """Generate SSE events."""
+        # For now, we'll do a regular chat and stream the response
+        # In the future, this could stream tokens as they're generated
+        chat_task = asyncio.ensure_future(orchestrator.chat(request, context))
         try:
-            # For now, we'll do a regular chat and stream the response
-            # In the future, this could stream tokens as they're generated
-            response = await orchestrator.chat(request, context)
+            # Send comment lines while waiting so proxies don't drop the idle connection
+            while True:
+                done, _ = await asyncio.wait({chat_task}, timeout=_SSE_PING_INTERVAL)
+                if done:
+                    break
+                yield ": ping\n\n"
+            response = chat_task.result()
 
             # Send the response as an SSE event
-            import json
-            yield f"data: {json.dumps(response.model_dump())}\n\n"
+            yield f"data: {response.model_dump_json()}\n\n"
             yield "data: [DONE]\n\n"
 
         except Exception as e:
             logger.exception("Stream failed")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield f"data: {_ERROR_EVENT.dump_json({'error': str(e)}).decode()}\n\n"
+
+        finally:
+            # No-op once the chat is done; stops it if the client disconnected first
+            chat_task.cancel()
 
     return StreamingResponse(
         generate(),
@@ -171,6 +175,7 @@ async def chat_stream(
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Stop nginx from buffering the stream
         }
     )
 
@@ -193,13 +198,7 @@ async def execute_task(
     """
     await orchestrator.initialize()
 
-    context = AgentContext(
-        session_id="task-execution",
-        workspace_id=workspace_id or "default",
-        user_id=user_id or "anonymous",
-        message_count=0,
-        working_memory=WorkingMemory(),
-    )
+    context = _build_context("task-execution", workspace_id, user_id)
 
     try:
         response = await orchestrator.execute_task(request, context)
@@ -241,13 +240,7 @@ async def orchestrate_workflow(
     """
     await orchestrator.initialize()
 
-    context = AgentContext(
-        session_id="workflow-execution",
-        workspace_id=workspace_id or "default",
-        user_id=user_id or "anonymous",
-        message_count=0,
-        working_memory=WorkingMemory(),
-    )
+    context = _build_context("workflow-execution", workspace_id, user_id)
 
     try:
         response = await orchestrator.orchestrate(request, context)
@@ -357,6 +350,13 @@ PREDEFINED_WORKFLOWS = {
 }
 
 
+# Validated once at import; the definitions never change
+_COMPILED_WORKFLOWS: dict[str, WorkflowDefinition] = {
+    workflow_id: WorkflowDefinition.model_validate(workflow_data)
+    for workflow_id, workflow_data in PREDEFINED_WORKFLOWS.items()
+}
+
+
 @router.get("/workflows/predefined")
 async def list_predefined_workflows() -> list[dict]:
     """List available predefined workflows."""
@@ -379,39 +379,13 @@ async def run_predefined_workflow(
     orchestrator: AgentOrchestrator = Depends(get_orchestrator)
 ) -> OrchestrateResponse:
     """Run a predefined workflow with given input."""
-    if workflow_id not in PREDEFINED_WORKFLOWS:
+    workflow = _COMPILED_WORKFLOWS.get(workflow_id)
+    if workflow is None:
         raise HTTPException(status_code=404, detail=f"Workflow not found: {workflow_id}")
 
-    from app.agents.types import WorkflowDefinition, WorkflowStep
-
-    workflow_data = PREDEFINED_WORKFLOWS[workflow_id]
-    workflow = WorkflowDefinition(
-        id=workflow_data["id"],
-        name=workflow_data["name"],
-        description=workflow_data["description"],
-        version=workflow_data["version"],
-        steps=[
-            WorkflowStep(
-                id=s["id"],
-                name=s["name"],
-                agent=AgentType(s["agent"]),
-                action=s["action"],
-                input=s["input"],
-                depends_on=s.get("depends_on", []),
-            )
-            for s in workflow_data["steps"]
-        ],
-    )
-
     request = OrchestrateRequest(workflow=workflow, input=input)
 
-    context = AgentContext(
-        session_id=f"workflow-{workflow_id}",
-        workspace_id=workspace_id or "default",
-        user_id=user_id or "anonymous",
-        message_count=0,
-        working_memory=WorkingMemory(),
-    )
+    context = _build_context(f"workflow-{workflow_id}", workspace_id, user_id)
 
     await orchestrator.initialize()
     return await orchestrator.orchestrate(request, context)
@@ -8,6 +8,8 @@ Provides ML/analytics endpoints for Phase 9B:
 - A/B test analysis
 """
 
+import math
+import statistics
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
@@ -77,6 +79,7 @@ class SearchRankingRequest(BaseModel):
     results: List[Dict[str, Any]]
     user_history: List[Dict[str, Any]] = []
     context: Dict[str, Any] = {}
+    top_k: Optional[int] = Field(default=None, ge=1)
 
 
 class SearchRankingResponse(BaseModel):
@@ -197,6 +200,7 @@ async def rank_search_results(
             query=request.query,
             user_history=request.user_history,
             context=context,
+            top_k=request.top_k,
         )
 
         # Convert back to response format
@@ -311,10 +315,6 @@ async def analyze_ab_test(
     Returns lift, confidence intervals, and recommendation.
     """
     try:
-        from app.analytics.ab_testing import ABTestAnalyzer
-        import statistics
-        import math
-
         control = request.control_data
         treatment = request.treatment_data
 
@@ -427,7 +427,9 @@ async def analytics_health():
 # ============================================================================
 
 
+_SQRT2 = math.sqrt(2.0)
+
+
 def _norm_cdf(x: float) -> float:
     """Standard normal CDF approximation."""
-    import math
-    return (1.0 + math.erf(x / math.sqrt(2.0))) / 2.0
+    return (1.0 + math.erf(x / _SQRT2)) / 2.0
@@ -3,12 +3,16 @@
 from datetime import date, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import TypeAdapter, ValidationError
 
 from app.models.schemas import ExtractedTask, ExtractTasksRequest, ExtractTasksResponse
 from app.services.llm import LLMService, get_llm_service
 
 router = APIRouter(prefix="/extract", tags=["extract"])
 
+# Built once; validates a whole task list in a single call
+_EXTRACTED_TASKS = TypeAdapter(list[ExtractedTask])
+
 SYSTEM_PROMPT = """You are a task extraction assistant for academic professionals (professors, researchers, lab managers).
 
 Your job is to identify actionable tasks from unstructured text like meeting notes, emails, or transcripts.
@@ -81,14 +85,18 @@ Convert relative dates (like "next Monday", "by end of week") to actual dates ba
         result = await llm.complete_json(prompt, SYSTEM_PROMPT)
 
         # Validate and parse response
-        tasks = []
-        for task_data in result.get("tasks", []):
-            try:
-                task = ExtractedTask.model_validate(task_data)
-                tasks.append(task)
-            except Exception:
-                # Skip malformed tasks
-                continue
+        task_list = result.get("tasks", [])
+        try:
+            tasks = _EXTRACTED_TASKS.validate_python(task_list)
+        except ValidationError:
+            # Some tasks are malformed; validate one by one and skip those
+            tasks = []
+            for task_data in task_list:
+                try:
+                    task = ExtractedTask.model_validate(task_data)
+                    tasks.append(task)
+                except Exception:
+                    continue
 
         return ExtractTasksResponse(
             tasks=tasks,
@@ -1,14 +1,18 @@
 """LLM service for interacting with AI providers."""
 
 import json
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from anthropic import Anthropic
-from openai import OpenAI
 from pydantic import BaseModel
 
 from app.config import Settings, get_settings
 
+if TYPE_CHECKING:
+    # The SDKs take about a second to import, so they are only loaded
+    # when a client is first needed
+    from anthropic import Anthropic
+    from openai import OpenAI
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -17,20 +21,24 @@ class LLMService:
 
     def __init__(self, settings: Settings | None = None):
         self.settings = settings or get_settings()
-        self._anthropic_client: Anthropic | None = None
-        self._openai_client: OpenAI | None = None
+        self._anthropic_client: "Anthropic | None" = None
+        self._openai_client: "OpenAI | None" = None
 
     @property
-    def anthropic(self) -> Anthropic:
+    def anthropic(self) -> "Anthropic":
         """Get Anthropic client (lazy initialization)."""
         if self._anthropic_client is None:
+            from anthropic import Anthropic
+
             self._anthropic_client = Anthropic(api_key=self.settings.anthropic_api_key)
         return self._anthropic_client
 
     @property
-    def openai(self) -> OpenAI:
+    def openai(self) -> "OpenAI":
         """Get OpenAI client (lazy initialization)."""
         if self._openai_client is None:
+            from openai import OpenAI
+
             self._openai_client = OpenAI(api_key=self.settings.openai_api_key)
         return self._openai_client
 
@@ -0,0 +1,361 @@
+"""
+Agent Orchestrator Tests
+
+Tests for multi-agent workflow orchestration.
+Run with: pytest tests/test_agents.py -v
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from app.agents.base import AgentResult, BaseAgent
+from app.agents.orchestrator import AgentOrchestrator
+from app.agents.types import (
+    AgentContext,
+    AgentStatus,
+    AgentType,
+    OrchestrateRequest,
+    WorkflowCondition,
+    WorkflowDefinition,
+    WorkflowStep,
+)
+
+
+class FakeAgent:
+    """Agent stub that records when each call starts and finishes."""
+
+    def __init__(self, agent_type, events, fail=False, delay=0.01):
+        self.agent_type = agent_type
+        self.events = events
+        self.fail = fail
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def execute(self, prompt, context):
+        self.events.append(("start", prompt))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        self.events.append(("end", prompt))
+        if self.fail:
+            return AgentResult(
+                agent_type=self.agent_type,
+                status=AgentStatus.FAILED,
+                output={},
+                error="boom",
+            )
+        return AgentResult(
+            agent_type=self.agent_type,
+            status=AgentStatus.COMPLETED,
+            output={"prompt": prompt},
+        )
+
+
+class FakeRegistry:
+    """Registry stub mapping agent types to fake agents."""
+
+    def __init__(self, agents):
+        self.agents = agents
+
+    def get(self, agent_type):
+        return self.agents.get(agent_type)
+
+
+CONTEXT = AgentContext(session_id="session-1", workspace_id="ws-1", user_id="user-1")
+
+
+def _step(step_id, agent=AgentType.TASK, input=None, **kwargs):
+    return WorkflowStep(
+        id=step_id, name=step_id, agent=agent, action=step_id, input=input or {}, **kwargs
+    )
+
+
+def _request(steps, error_handling="fail_fast"):
+    return OrchestrateRequest(
+        workflow=WorkflowDefinition(
+            id="wf", name="wf", description="", steps=steps, error_handling=error_handling
+        )
+    )
+
+
+def _orchestrator(events, project_agent=None):
+    registry = {
+        AgentType.TASK: FakeAgent(AgentType.TASK, events),
+        AgentType.PROJECT: project_agent or FakeAgent(AgentType.PROJECT, events),
+    }
+    return AgentOrchestrator(registry=FakeRegistry(registry)), registry
+
+
+def _position_prompt(events, kind, action):
+    return events[_position(events, kind, action)][1]
+
+
+def _position(events, kind, action):
+    return next(
+        i for i, (event, prompt) in enumerate(events)
+        if event == kind and f"'{action}'" in prompt
+    )
+
+
+class PromptAgent(BaseAgent):
+    """Minimal concrete agent for system prompt tests."""
+
+    agent_type = AgentType.TASK
+    name = "prompt"
+    description = ""
+    system_prompt = "Class prompt"
+    capabilities = []
+    tools = []
+
+    async def plan(self, request, context):
+        raise NotImplementedError
+
+    async def execute(self, request, context):
+        raise NotImplementedError
+
+
+class TestSystemPromptContext:
+    """Tests for injecting context into agent system prompts."""
+
+    CONTEXT = AgentContext(
+        session_id="session-1", workspace_id="ws-1", user_id="user-1", user_tasks=[{}]
+    )
+
+    def test_class_prompt(self):
+        agent = PromptAgent(llm_service=object())
+
+        prompt = agent._inject_context(agent.system_prompt, self.CONTEXT)
+
+        assert prompt == "Class prompt\n\n## Context\nUser has 1 tasks"
+
+    def test_instance_prompt_override(self):
+        agent = PromptAgent(llm_service=object())
+        agent.system_prompt = "Instance prompt"
+
+        prompt = agent._inject_context(agent.system_prompt, self.CONTEXT)
+
+        assert prompt == "Instance prompt\n\n## Context\nUser has 1 tasks"
+
+    def test_class_prompt_reassigned(self, monkeypatch):
+        monkeypatch.setattr(PromptAgent, "system_prompt", "New prompt")
+        agent = PromptAgent(llm_service=object())
+
+        prompt = agent._inject_context(agent.system_prompt, self.CONTEXT)
+
+        assert prompt == "New prompt\n\n## Context\nUser has 1 tasks"
+
+
+class TestWorkflowScheduling:
+    """Tests for dependency-wave scheduling of workflow steps."""
+
+    async def test_independent_steps_overlap(self):
+        events = []
+        orchestrator, _ = _orchestrator(events)
+        steps = [
+            _step("projects", AgentType.PROJECT),
+            _step("tasks"),
+            _step("compile", depends_on=["projects", "tasks"]),
+        ]
+
+        response = await orchestrator.orchestrate(_request(steps), CONTEXT)
+
+        assert response.status == "completed"
+        # Both first-wave steps start before either finishes
+        assert _position(events, "start", "tasks") < _position(events, "end", "projects")
+        # The dependent step waits for both
+        compile_start = _position(events, "start", "compile")
+        assert compile_start > _position(events, "end", "projects")
+        assert compile_start > _position(events, "end", "tasks")
+
+    async def test_results_in_definition_order(self):
+        events = []
+        slow = FakeAgent(AgentType.PROJECT, events, delay=0.05)
+        orchestrator, _ = _orchestrator(events, slow)
+        steps = [_step("slow", AgentType.PROJECT), _step("fast"), _step("last")]
+
+        response = await orchestrator.orchestrate(_request(steps), CONTEXT)
+
+        assert list(response.results) == ["slow", "fast", "last"]
+
+    async def test_each_step_runs_once(self):
+        events = []
+        orchestrator, _ = _orchestrator(events)
+        steps = [
+            _step("a"),
+            _step("b", depends_on=["a"]),
+            _step("c", depends_on=["a"]),
+            _step("d", depends_on=["b", "c"]),
+        ]
+
+        await orchestrator.orchestrate(_request(steps), CONTEXT)
+
+        assert [event for event, _ in events].count("start") == 4
+
+    async def test_parallelism_is_capped(self, monkeypatch):
+        # app.agents re-exports names that shadow the submodule attribute
+        module = sys.modules[AgentOrchestrator.__module__]
+        monkeypatch.setattr(module, "MAX_PARALLEL_STEPS", 2)
+        events = []
+        orchestrator, agents = _orchestrator(events)
+        steps = [_step(f"s{i}") for i in range(5)]
+
+        response = await orchestrator.orchestrate(_request(steps), CONTEXT)
+
+        assert response.status == "completed"
+        assert agents[AgentType.TASK].max_running == 2
+
+    async def test_empty_workflow(self):
+        orchestrator, _ = _orchestrator([])
+
+        response = await orchestrator.orchestrate(_request([]), CONTEXT)
+
+        assert response.status == "completed"
+        assert response.results == {}
+
+    async def test_prev_reference_runs_in_order(self):
+        events = []
+        orchestrator, _ = _orchestrator(events)
+        steps = [_step("a"), _step("b", input={"p": "{{prev.prompt}}"})]
+
+        response = await orchestrator.orchestrate(_request(steps), CONTEXT)
+
+        assert response.status == "completed"
+        assert "action 'a'" in _position_prompt(events, "start", "b")
+
+    async def test_step_reference_waits_for_step(self):
+        events = []
+        slow = FakeAgent(AgentType.PROJECT, events, delay=0.05)
+        orchestrator, _ = _orchestrator(events, slow)
+        steps = [
+            _step("source", AgentType.PROJECT),
+            _step("reader", input={"p": "{{steps.source.output.prompt}}"}),
+        ]
+
+        response = await orchestrator.orchestrate(_request(steps), CONTEXT)
+
+        assert response.status == "completed"
+        assert _position(events, "start", "reader") > _position(events, "end", "source")
+        assert "action 'source'" in _position_prompt(events, "start", "reader")
+
+    async def test_step_condition_waits_for_step(self):
+        events = []
+        failing = FakeAgent(AgentType.PROJECT, events, fail=True)
+        orchestrator, _ = _orchestrator(events, failing)
+        steps = [
+            _step("check", AgentType.PROJECT, on_error="skip"),
+            _step(
+                "gated",
+                condition=WorkflowCondition(type="if", expression="steps.check"),
+            ),
+        ]
+
+        response = await orchestrator.orchestrate(_request(steps), CONTEXT)
+
+        assert response.results["gated"].status == "skipped"
+
+    async def test_circular_dependency(self):
+        orchestrator, _ = _orchestrator([])
+        steps = [_step("a", depends_on=["b"]), _step("b", depends_on=["a"])]
+
+        response = await orchestrator.orchestrate(_request(steps), CONTEXT)
+
+        assert response.status == "failed"
+        assert "Circular dependency" in response.error
+
+
+class TestWorkflowErrorHandling:
+    """Tests for failing steps in scheduled workflows."""
+
+    async def test_fail_fast_stops_dependents(self):
+        events = []
+        failing = FakeAgent(AgentType.PROJECT, events, fail=True)
+        orchestrator, _ = _orchestrator(events, failing)
+        steps = [
+            _step("broken", AgentType.PROJECT),
+            _step("sibling"),
+            _step("after", depends_on=["broken"]),
+        ]
+
+        response = await orchestrator.orchestrate(_request(steps), CONTEXT)
+
+        assert response.status == "failed"
+        assert response.error == "Step failed: broken - boom"
+        # The rest of the wave still finishes; later waves never start
+        assert response.results["sibling"].status == "completed"
+        assert "after" not in response.results
+
+    async def test_continue_skips_unsatisfied_dependents(self):
+        events = []
+        failing = FakeAgent(AgentType.PROJECT, events, fail=True)
+        orchestrator, _ = _orchestrator(events, failing)
+        steps = [
+            _step("broken", AgentType.PROJECT, on_error="skip"),
+            _step("after", depends_on=["broken"]),
+            _step("independent"),
+        ]
+
+        response = await orchestrator.orchestrate(
+            _request(steps, error_handling="continue"), CONTEXT
+        )
+
+        assert response.status == "completed"
+        assert response.results["broken"].status == "failed"
+        assert "after" not in response.results
+        assert response.results["independent"].status == "completed"
+
+    async def test_fallback_agent(self):
+        events = []
+        failing = FakeAgent(AgentType.PROJECT, events, fail=True)
+        orchestrator, _ = _orchestrator(events, failing)
+        steps = [
+            _step(
+                "primary",
+                AgentType.PROJECT,
+                on_error="fallback",
+                fallback_agent=AgentType.TASK,
+            ),
+            _step("after", depends_on=["primary"]),
+        ]
+
+        response = await orchestrator.orchestrate(_request(steps), CONTEXT)
+
+        assert response.status == "completed"
+        assert response.results["primary"].status == "completed"
+        assert response.results["primary"].agent_type == AgentType.TASK
+        assert response.results["after"].status == "completed"
+
+
+@pytest.mark.parametrize(
+    "depends_on, expected",
+    [
+        ({}, [["a", "b", "c"]]),
+        ({"b": ["a"], "c": ["b"]}, [["a"], ["b"], ["c"]]),
+        ({"c": ["a"]}, [["a", "b"], ["c"]]),
+    ],
+)
+def test_execution_waves(depends_on, expected):
+    steps = [_step(step_id, depends_on=depends_on.get(step_id, [])) for step_id in "abc"]
+
+    waves = AgentOrchestrator(registry=FakeRegistry({}))._execution_waves(steps)
+
+    assert [[step.id for step in wave] for wave in waves] == expected
+
+
+@pytest.mark.parametrize(
+    "inputs, expected",
+    [
+        ({"b": "{{steps.a.output}}"}, [["a", "c"], ["b"]]),
+        ({"a": "{{steps.c.output}}"}, [["a", "b", "c"]]),
+        ({"c": "{{ prev.key }}"}, [["a"], ["b"], ["c"]]),
+    ],
+)
+def test_execution_waves_follow_references(inputs, expected):
+    steps = [_step(step_id, input={"p": inputs.get(step_id, "")}) for step_id in "abc"]
+
+    waves = AgentOrchestrator(registry=FakeRegistry({}))._execution_waves(steps)
+
+    assert [[step.id for step in wave] for wave in waves] == expected
@@ -5,12 +5,33 @@ Tests for the Phase 9B analytics endpoints.
 Run with: pytest tests/test_analytics.py -v
 """
 
+import pickle
+
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
+from scipy import stats
 from datetime import datetime
 
 # Import the FastAPI app
 from app.main import app
+from app.analytics import ab_testing
+from app.analytics.ab_testing import (
+    ABTestAnalyzer,
+    ExperimentConfig,
+    Variant,
+    VariantMetrics,
+    bootstrap_lift_ci,
+    obrien_fleming_boundary_curve,
+)
+from app.analytics.onboarding import FunnelStage, OnboardingFunnelAnalyzer
+from app.analytics.validation import (
+    FeatureValidator,
+    MetricType,
+    RunningStats,
+    StatisticalTest,
+    _mann_whitney_rows,
+)
 
 client = TestClient(app)
 
@@ -276,7 +297,7 @@ class TestABTestAnalysis:
         data = response.json()
         assert data["control_rate"] == 0.5
         assert data["treatment_rate"] == 0.7
-        assert data["lift"] == 0.4  # (0.7 - 0.5) / 0.5
+        assert data["lift"] == pytest.approx(0.4)  # (0.7 - 0.5) / 0.5
         assert data["is_significant"] == True
         assert data["recommendation"] == "ship"
 
@@ -452,3 +473,590 @@ class TestEdgeCases:
 
         response = client.post("/api/analytics/onboarding/predict", json=request_data)
         assert response.status_code == 200
+
+
+class TestFeatureValidatorReport:
+    """Tests for FeatureValidator report assembly."""
+
+    def _validator(self):
+        validator = FeatureValidator()
+        validator.register_metric(
+            "conversion", MetricType.PROPORTION, "increase", 0.05, is_primary=True
+        )
+        validator.register_guardrail("latency", MetricType.CONTINUOUS, threshold=0.1)
+        return validator
+
+    def test_no_metrics_supplied(self):
+        """Test that a report with no tested metrics passes trivially."""
+        report = FeatureValidator().validate("feature", {}, {})
+
+        assert len(report.metrics) == 0
+        assert report.overall_passed is True
+        assert report.primary_metrics_passed is True
+        assert report.guardrail_metrics_passed is True
+
+    def test_no_registered_metric_in_data(self):
+        """Test that data for unregistered metrics is ignored."""
+        report = self._validator().validate(
+            "feature", {"other": [1.0, 2.0]}, {"other": [1.0, 2.0]}
+        )
+
+        assert len(report.metrics) == 0
+        assert report.overall_passed is True
+
+    def test_partially_matching_data(self):
+        """Test that only metrics present on both sides are validated."""
+        report = self._validator().validate(
+            "feature",
+            {"conversion": [0, 1] * 50, "latency": [1.0, 1.2, 0.9]},
+            {"conversion": [0, 1] * 50},
+        )
+
+        assert [result.metric_name for result in report.metrics] == ["conversion"]
+        result = report.metrics[0]
+        assert result.kind == "primary"
+        assert isinstance(result.passed, bool)
+        assert result.sample_size_baseline == 100
+        assert report.guardrail_metrics_passed is True
+
+    @pytest.mark.parametrize("alpha, power", [(0.05, 0.80), (0.01, 0.90)])
+    def test_required_sample_size_uses_alpha_and_power(self, alpha, power):
+        """Test that the sample size target uses exact normal quantiles."""
+        validator = FeatureValidator(alpha=alpha, power=power)
+        validator.register_metric(
+            "conversion", MetricType.PROPORTION, "increase", 0.1, is_primary=True
+        )
+        z = stats.norm.ppf(1 - alpha / 2) + stats.norm.ppf(power)
+
+        assert validator._estimate_required_sample_size() == int(np.ceil(2 * (z / 0.1) ** 2))
+
+
+def _stage_event(user_id, event_name, timestamp):
+    return {"user_id": user_id, "event_name": event_name, "timestamp": timestamp}
+
+
+class TestOnboardingCohortUpdates:
+    """Tests for incremental cohort updates."""
+
+    USERS = ["u1", "u2", "u3"]
+
+    def _analyzer(self):
+        analyzer = OnboardingFunnelAnalyzer()
+        analyzer.create_cohort(
+            "c", datetime(2024, 1, 1), datetime(2024, 1, 31), list(self.USERS)
+        )
+        return analyzer
+
+    def _counts(self, cohort):
+        return {
+            stage: (metrics.entered_count, metrics.completed_count)
+            for stage, metrics in cohort.stage_metrics.items()
+        }
+
+    def test_update_matches_full_analysis(self):
+        """Test that batched updates give the same funnel as one analysis."""
+        events = [
+            _stage_event("u1", "onboarding_started", "2024-01-01T10:00:00"),
+            _stage_event("u1", "profile_completed", "2024-01-01T10:05:00"),
+            _stage_event("u2", "onboarding_started", "2024-01-02T09:00:00"),
+            _stage_event("u2", "profile_completed", "2024-01-02T09:30:00"),
+            _stage_event("u3", "onboarding_started", "2024-01-03T08:00:00"),
+        ]
+        incremental = self._analyzer()
+        incremental.update_cohort("c", events[:3])
+        cohort = incremental.update_cohort("c", events[3:])
+
+        full = self._analyzer().analyze_cohort("c", events)
+
+        assert self._counts(cohort) == self._counts(full)
+
+    def test_replayed_batch_is_noop(self):
+        """Test that updating with the same batch twice changes nothing."""
+        batch = [
+            _stage_event("u1", "onboarding_started", "2024-01-01T10:00:00"),
+            _stage_event("u1", "profile_completed", "2024-01-01T10:05:00"),
+        ]
+        analyzer = self._analyzer()
+        first = self._counts(analyzer.update_cohort("c", batch))
+        second = self._counts(analyzer.update_cohort("c", batch))
+
+        assert first == second
+        assert first[FunnelStage.SIGNUP] == (1, 1)
+
+    def test_update_keeps_users_from_earlier_analyses(self):
+        """Test that update_cohort builds on every analyze_cohort batch."""
+        analyzer = self._analyzer()
+        analyzer.analyze_cohort(
+            "c", [_stage_event("u1", "onboarding_started", "2024-01-01T10:00:00")]
+        )
+        cohort = analyzer.analyze_cohort(
+            "c",
+            [
+                _stage_event("u2", "onboarding_started", "2024-01-02T09:00:00"),
+                _stage_event("u2", "profile_completed", "2024-01-02T09:30:00"),
+            ],
+        )
+        assert cohort.stage_metrics[FunnelStage.SIGNUP].entered_count == 2
+
+        cohort = analyzer.update_cohort(
+            "c",
+            [
+                _stage_event("u3", "onboarding_started", "2024-01-03T08:00:00"),
+                _stage_event("u3", "profile_completed", "2024-01-03T08:10:00"),
+            ],
+        )
+
+        counts = self._counts(cohort)
+        assert counts[FunnelStage.SIGNUP] == (3, 3)
+        assert counts[FunnelStage.PROFILE_COMPLETE] == (2, 2)
+
+    def test_reanalyzed_batch_is_noop(self):
+        """Test that analyze_cohort and update_cohort agree on repeated events."""
+        batch = [_stage_event("u1", "onboarding_started", "2024-01-01T10:00:00")]
+        analyzer = self._analyzer()
+        analyzer.analyze_cohort("c", batch)
+        cohort = analyzer.analyze_cohort("c", batch)
+        assert self._counts(cohort)[FunnelStage.SIGNUP] == (1, 1)
+
+        cohort = analyzer.update_cohort("c", [])
+
+        assert self._counts(cohort)[FunnelStage.SIGNUP] == (1, 1)
+
+    def test_earliest_stage_entry_wins(self):
+        """Test that repeated stage events keep the first entry in any order."""
+        events = [
+            _stage_event("u1", "onboarding_started", "2024-01-01T10:00:00"),
+            _stage_event("u1", "profile_completed", "2024-01-01T12:00:00"),
+            _stage_event("u1", "profile_completed", "2024-01-01T10:30:00"),
+        ]
+        full = self._analyzer().analyze_cohort("c", events)
+        incremental = self._analyzer()
+        incremental.update_cohort("c", events[:2])
+        cohort = incremental.update_cohort("c", events[2:])
+
+        for analyzed in (full, cohort):
+            metrics = analyzed.stage_metrics[FunnelStage.PROFILE_COMPLETE]
+            assert metrics.median_time_seconds == pytest.approx(1800.0)
+
+    def test_empty_batch(self):
+        """Test that an empty batch leaves the funnel empty."""
+        cohort = self._analyzer().update_cohort("c", [])
+
+        assert all(counts == (0, 0) for counts in self._counts(cohort).values())
+
+    def test_unknown_cohort(self):
+        """Test that updating an unknown cohort raises."""
+        with pytest.raises(ValueError):
+            OnboardingFunnelAnalyzer().update_cohort("missing", [])
+
+
+def _register_experiment(analyzer, experiment_id, minimum_sample_size=1000):
+    analyzer.register_experiment(
+        ExperimentConfig(
+            experiment_id=experiment_id,
+            name=experiment_id,
+            description="",
+            variants=[
+                Variant(name="control", is_control=True),
+                Variant(name="treatment"),
+            ],
+            primary_metric="conversion",
+            minimum_sample_size=minimum_sample_size,
+        )
+    )
+
+
+class TestAnalyzeMany:
+    """Tests for batched multi-experiment analysis."""
+
+    NOW = datetime(2024, 2, 1)
+
+    def _analyzer(self, *experiment_ids):
+        analyzer = ABTestAnalyzer()
+        for experiment_id in experiment_ids:
+            _register_experiment(analyzer, experiment_id, minimum_sample_size=10)
+        return analyzer
+
+    def _assert_same(self, batched, single):
+        assert batched.relative_lift == pytest.approx(single.relative_lift)
+        assert batched.p_value == pytest.approx(single.p_value)
+        assert batched.winner == single.winner
+        assert batched.is_significant == single.is_significant
+        assert batched.total_sample_size == single.total_sample_size
+        assert batched.variant_metrics == single.variant_metrics
+        assert batched.recommendation == single.recommendation
+
+    def test_matches_analyze(self):
+        """Test that each batched result equals a separate analyze() call."""
+        batch = {
+            "lift": {
+                "control": [1.0] * 30 + [0.0] * 70,
+                "treatment": [1.0] * 60 + [0.0] * 40,
+            },
+            "flat": {"control": [3.0, 4.0, 5.0, 4.0], "treatment": [4.0, 3.0, 5.0, 4.0]},
+            "drop": {"control": [5.0, 6.0, 7.0], "treatment": [1.0, 2.0, 1.5]},
+        }
+        analyzer = self._analyzer(*batch)
+
+        results = analyzer.analyze_many(batch, "conversion", now=self.NOW)
+
+        assert list(results) == list(batch)
+        for experiment_id, data in batch.items():
+            single = analyzer.analyze(experiment_id, data, "conversion", now=self.NOW)
+            self._assert_same(results[experiment_id], single)
+        assert results["lift"].winner == "treatment"
+
+    def test_edge_cases_match_analyze(self):
+        """Test empty variants, single observations and zero variance."""
+        batch = {
+            "empty": {"control": [1.0, 2.0]},
+            "single": {"control": [1.0], "treatment": [2.0]},
+            "constant": {"control": [1.0] * 20, "treatment": [1.0] * 20},
+        }
+        analyzer = self._analyzer(*batch)
+
+        results = analyzer.analyze_many(batch, "conversion", now=self.NOW)
+
+        for experiment_id, data in batch.items():
+            single = analyzer.analyze(experiment_id, data, "conversion", now=self.NOW)
+            self._assert_same(results[experiment_id], single)
+        assert results["empty"].relative_lift == 0.0
+        assert results["empty"].p_value == 1.0
+        assert results["constant"].relative_lift == 0.0
+
+    def test_multiple_treatments(self):
+        """Test that the best of several treatments is reported."""
+        analyzer = ABTestAnalyzer()
+        analyzer.register_experiment(
+            ExperimentConfig(
+                experiment_id="multi",
+                name="multi",
+                description="",
+                variants=[
+                    Variant(name="control", weight=0.34, is_control=True),
+                    Variant(name="a", weight=0.33),
+                    Variant(name="b", weight=0.33),
+                ],
+                primary_metric="conversion",
+            )
+        )
+        data = {"control": [1.0, 2.0, 3.0], "a": [2.0, 3.0, 4.0], "b": [4.0, 5.0, 6.0]}
+
+        batched = analyzer.analyze_many({"multi": data}, "conversion", now=self.NOW)["multi"]
+        single = analyzer.analyze("multi", data, "conversion", now=self.NOW)
+
+        self._assert_same(batched, single)
+        assert batched.relative_lift == pytest.approx(1.5)
+
+    def test_empty_batch(self):
+        """Test that an empty batch gives no results."""
+        assert ABTestAnalyzer().analyze_many({}, "conversion") == {}
+
+    def test_unknown_experiment(self):
+        """Test that an unregistered experiment raises."""
+        with pytest.raises(ValueError):
+            ABTestAnalyzer().analyze_many({"missing": {}}, "conversion")
+
+
+class TestVariantMetrics:
+    """Tests for per-variant metric containers."""
+
+    def test_pickle_round_trip(self):
+        """Test that pickling keeps observations and running statistics."""
+        metrics = VariantMetrics("control", 3, values=[1.0, 0.0, 1.0])
+        metrics.compute_stats()
+
+        restored = pickle.loads(pickle.dumps(metrics))
+        restored.update(1.0)
+        metrics.update(1.0)
+
+        np.testing.assert_array_equal(restored.values, metrics.values)
+        assert restored.mean_value == metrics.mean_value
+        assert restored.conversions == metrics.conversions == 3
+
+
+class TestBootstrapLiftCI:
+    """Tests for bootstrap confidence intervals on relative lift."""
+
+    def _samples(self):
+        rng = np.random.default_rng(1)
+        return rng.normal(10.0, 2.0, 300), rng.normal(11.0, 2.0, 250)
+
+    def test_interval_covers_point_lift(self):
+        """Test that the interval brackets the observed lift."""
+        control, treatment = self._samples()
+        lift = (treatment.mean() - control.mean()) / control.mean()
+
+        lower, upper = bootstrap_lift_ci(control, treatment, n_iters=2000)
+
+        assert lower < lift < upper
+        assert lower > 0
+
+    def test_seeded_and_chunk_independent(self, monkeypatch):
+        """Test that a seed fixes the interval regardless of chunking."""
+        control, treatment = self._samples()
+        interval = bootstrap_lift_ci(control, treatment, n_iters=500, seed=3)
+
+        assert bootstrap_lift_ci(control, treatment, n_iters=500, seed=3) == interval
+        monkeypatch.setattr(ab_testing, "_BOOTSTRAP_CHUNK_ELEMENTS", 1000)
+        assert bootstrap_lift_ci(control, treatment, n_iters=500, seed=3) == interval
+
+    def test_zero_variance(self):
+        """Test that constant samples give a degenerate interval at the lift."""
+        lower, upper = bootstrap_lift_ci([2.0] * 10, [3.0] * 10, n_iters=100)
+
+        assert lower == pytest.approx(0.5)
+        assert upper == pytest.approx(0.5)
+
+    def test_single_observations(self):
+        """Test samples of one value each."""
+        assert bootstrap_lift_ci([2.0], [3.0], n_iters=50) == pytest.approx((0.5, 0.5))
+
+    def test_zero_control_mean(self):
+        """Test that a zero control mean gives zero lift, as in analyze()."""
+        assert bootstrap_lift_ci([0.0, 0.0], [1.0, 2.0], n_iters=50) == (0.0, 0.0)
+
+    def test_empty_inputs(self):
+        """Test that empty samples or no iterations give an empty interval."""
+        assert bootstrap_lift_ci([], [1.0], n_iters=50) == (0.0, 0.0)
+        assert bootstrap_lift_ci([1.0], [], n_iters=50) == (0.0, 0.0)
+        assert bootstrap_lift_ci([1.0], [2.0], n_iters=0) == (0.0, 0.0)
+
+    def test_analyze_attaches_interval(self):
+        """Test that analyze() only resamples when asked to."""
+        analyzer = ABTestAnalyzer()
+        _register_experiment(analyzer, "ci")
+        control, treatment = self._samples()
+        data = {"control": control.tolist(), "treatment": treatment.tolist()}
+
+        assert analyzer.analyze("ci", data, "conversion").confidence_interval is None
+        result = analyzer.analyze("ci", data, "conversion", bootstrap_iterations=500)
+        assert result.confidence_interval == bootstrap_lift_ci(
+            control, treatment, n_iters=500
+        )
+
+
+class TestSequentialAnalysis:
+    """Tests for O'Brien-Fleming sequential boundaries."""
+
+    def test_full_information_spends_alpha(self):
+        """Test that all of alpha is spent at the final look."""
+        assert obrien_fleming_boundary_curve(0.05, [1.0])[0] == pytest.approx(0.05)
+        assert obrien_fleming_boundary_curve(0.05, [0.0])[0] == 0.0
+
+    def test_boundary_is_conservative_early(self):
+        """Test that early looks spend far less than alpha."""
+        spent = obrien_fleming_boundary_curve(0.05, [0.25, 0.5, 0.75, 0.999])
+
+        assert spent[0] == pytest.approx(8.8575e-5, rel=1e-3)
+        assert spent[1] == pytest.approx(5.5746e-3, rel=1e-3)
+        assert all(a < b for a, b in zip(spent, spent[1:]))
+        assert spent[-1] < 0.05
+
+    def test_tabulated_boundary_matches_curve(self):
+        """Test that interim looks interpolate the exact curve closely."""
+        analyzer = ABTestAnalyzer()
+        for fraction in [0.001, 0.1, 0.333, 0.5, 0.9, 0.9999]:
+            exact = obrien_fleming_boundary_curve(0.05, [fraction])[0]
+            assert analyzer._obrien_fleming_boundary(0.05, fraction) == pytest.approx(
+                exact, abs=1e-7
+            )
+
+    def test_early_stop_needs_strong_evidence(self):
+        """Test that a modest effect cannot stop the experiment at half information."""
+        analyzer = ABTestAnalyzer()
+        _register_experiment(analyzer, "seq", minimum_sample_size=400)
+        data = {
+            "control": [1.0] * 50 + [0.0] * 50,
+            "treatment": [1.0] * 60 + [0.0] * 40,
+        }
+
+        result = analyzer.run_sequential_analysis("seq", data)
+
+        assert result["information_fraction"] == 0.5
+        assert result["z_boundary"] > 2.5
+        assert result["can_stop_early"] is False
+
+    def test_early_stop_on_large_effect(self):
+        """Test that an overwhelming effect can stop the experiment early."""
+        analyzer = ABTestAnalyzer()
+        _register_experiment(analyzer, "seq", minimum_sample_size=400)
+        data = {
+            "control": [1.0] * 20 + [0.0] * 80,
+            "treatment": [1.0] * 80 + [0.0] * 20,
+        }
+
+        result = analyzer.run_sequential_analysis("seq", data)
+
+        assert result["can_stop_early"] is True
+
+
+class TestMannWhitneyValidation:
+    """Tests for rank-based validation of count and rate metrics."""
+
+    def test_rows_match_scipy(self):
+        """Test each row's p-value against scipy's asymptotic test, with ties."""
+        rng = np.random.default_rng(7)
+        baseline = rng.poisson(3.0, size=(4, 40)).astype(float)
+        treatment = rng.poisson(3.6, size=(4, 35)).astype(float)
+
+        p_values = _mann_whitney_rows(baseline, treatment)
+
+        for row, p_value in enumerate(p_values):
+            expected = stats.mannwhitneyu(
+                baseline[row], treatment[row], method="asymptotic"
+            ).pvalue
+            assert p_value == pytest.approx(expected)
+
+    def test_all_values_tied(self):
+        """Test that zero variance gives p=1 rather than NaN."""
+        assert _mann_whitney_rows(np.ones((1, 5)), np.ones((1, 4))).tolist() == [1.0]
+
+    def test_single_observations(self):
+        """Test samples of one value each."""
+        p_values = _mann_whitney_rows(np.array([[1.0]]), np.array([[2.0]]))
+
+        assert p_values.tolist() == [1.0]
+
+    def test_scalar_helper(self):
+        """Test the per-metric helper, including empty samples."""
+        validator = FeatureValidator()
+        p_value, interval = validator._mann_whitney([1, 2, 3, 4], [5, 6, 7, 8])
+
+        assert p_value == pytest.approx(
+            stats.mannwhitneyu([1, 2, 3, 4], [5, 6, 7, 8], method="asymptotic").pvalue
+        )
+        assert interval == validator._t_test([1, 2, 3, 4], [5, 6, 7, 8])[1]
+        assert validator._mann_whitney([], [1.0]) == (1.0, (0.0, 0.0))
+
+    def test_count_metrics_default_to_mann_whitney(self):
+        """Test that count metrics are rank-tested unless overridden."""
+        validator = FeatureValidator()
+        validator.register_metric("tasks", MetricType.COUNT, "increase", 0.05)
+        validator.register_metric(
+            "sessions", MetricType.COUNT, "increase", 0.05, test=StatisticalTest.T_TEST
+        )
+        baseline = [0.0, 1.0, 1.0, 2.0, 3.0, 8.0] * 10
+        treatment = [1.0, 2.0, 2.0, 3.0, 4.0, 20.0] * 10
+
+        report = validator.validate(
+            "feature",
+            {"tasks": baseline, "sessions": baseline},
+            {"tasks": treatment, "sessions": treatment},
+        )
+
+        results = {result.metric_name: result for result in report.metrics}
+        assert results["tasks"].test_used == StatisticalTest.MANN_WHITNEY
+        assert results["sessions"].test_used == StatisticalTest.T_TEST
+        assert results["tasks"].p_value == pytest.approx(
+            stats.mannwhitneyu(baseline, treatment, method="asymptotic").pvalue
+        )
+        # Both report Welch's interval for the difference in means
+        assert results["tasks"].confidence_interval == results["sessions"].confidence_interval
+
+
+class TestRunningStats:
+    """Tests for streaming metric summaries."""
+
+    VALUES = [3.0, 1.5, 4.0, 1.0, 5.5, 9.0, 2.5, 6.0]
+
+    def test_single_updates_match_numpy(self):
+        """Test Welford updates against numpy's mean and sample variance."""
+        summary = RunningStats()
+        for value in self.VALUES:
+            summary.update(value)
+
+        assert summary.n == len(self.VALUES)
+        assert summary.mean == pytest.approx(np.mean(self.VALUES))
+        assert summary.variance == pytest.approx(np.var(self.VALUES, ddof=1))
+
+    def test_batches_and_shards_merge_exactly(self):
+        """Test that batch updates and combined shards equal one pass."""
+        whole = RunningStats.from_values(self.VALUES)
+        batched = RunningStats()
+        batched.update_batch(self.VALUES[:3])
+        batched.update_batch(self.VALUES[3:])
+        combined = RunningStats.from_values(self.VALUES[:5]).combine(
+            RunningStats.from_values(self.VALUES[5:])
+        )
+
+        for merged in (batched, combined):
+            assert merged.n == whole.n
+            assert merged.mean == pytest.approx(whole.mean)
+            assert merged.m2 == pytest.approx(whole.m2)
+
+    def test_combine_with_empty(self):
+        """Test that an empty summary is the identity for combine()."""
+        summary = RunningStats.from_values(self.VALUES)
+
+        assert RunningStats().combine(summary) == summary
+        assert summary.combine(RunningStats()) == summary
+
+    def test_small_samples(self):
+        """Test empty, single-value and constant summaries."""
+        empty = RunningStats.from_values([])
+        assert (empty.n, len(empty), empty.variance) == (0, 0, 0.0)
+        assert RunningStats.from_values([4.0]).variance == 0.0
+        assert RunningStats.from_values([2.0] * 5).variance == 0.0
+
+    def _validator(self):
+        validator = FeatureValidator()
+        validator.register_metric("time", MetricType.CONTINUOUS, "decrease", 0.05)
+        validator.register_metric("conversion", MetricType.PROPORTION, "increase", 0.05)
+        validator.register_metric("tasks", MetricType.COUNT, "increase", 0.05)
+        return validator
+
+    def test_validate_matches_raw_values(self):
+        """Test that summaries give the same results as raw samples."""
+        rng = np.random.default_rng(3)
+        baseline = {
+            "time": rng.normal(10.0, 2.0, 200).tolist(),
+            "conversion": (rng.random(200) < 0.3).astype(float).tolist(),
+        }
+        treatment = {
+            "time": rng.normal(9.5, 2.0, 180).tolist(),
+            "conversion": (rng.random(180) < 0.4).astype(float).tolist(),
+        }
+
+        raw = self._validator().validate("feature", baseline, treatment)
+        summarized = self._validator().validate(
+            "feature",
+            {name: RunningStats.from_values(values) for name, values in baseline.items()},
+            {name: RunningStats.from_values(values) for name, values in treatment.items()},
+        )
+
+        for raw_result, summary_result in zip(raw.metrics, summarized.metrics):
+            assert summary_result.metric_name == raw_result.metric_name
+            assert summary_result.p_value == pytest.approx(raw_result.p_value)
+            assert summary_result.confidence_interval == pytest.approx(
+                raw_result.confidence_interval
+            )
+            assert summary_result.passed == raw_result.passed
+        assert summarized.sample_size_adequate == raw.sample_size_adequate
+
+    def test_rank_test_falls_back_to_welch(self):
+        """Test that Mann-Whitney metrics use Welch's t-test on summaries."""
+        report = self._validator().validate(
+            "feature",
+            {"tasks": RunningStats.from_values([1.0, 2.0, 2.0, 5.0])},
+            {"tasks": [2.0, 3.0, 4.0, 6.0]},
+        )
+
+        assert report.metrics[0].test_used == StatisticalTest.T_TEST
+
+    def test_single_value_summaries(self):
+        """Test that n=1 summaries are not significant."""
+        report = self._validator().validate(
+            "feature",
+            {"time": RunningStats.from_values([1.0])},
+            {"time": RunningStats.from_values([2.0])},
+        )
+
+        assert report.metrics[0].p_value == 1.0
+
+    def test_empty_summary_raises(self):
+        """Test that a summary with no samples is rejected."""
+        with pytest.raises(ValueError):
+            self._validator().validate(
+                "feature", {"time": RunningStats()}, {"time": RunningStats.from_values([1.0])}
+            )
@@ -7,209 +7,23 @@ Run with: pytest tests/test_ml_models.py -v
 """
 
 import pytest
-import sys
 import math
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Set
-
-
-# Inline implementations for testing without full app imports
-# These mirror the actual implementations in app/ml/models/
-
-
-@dataclass
-class SearchRankingFeatures:
-    """Features for ranking a single search result."""
-    title_exact_match: float = 0.0
-    title_token_overlap: float = 0.0
-    char_ngram_similarity: float = 0.0
-    title_length: int = 0
-    title_word_count: int = 0
-    user_previously_selected: float = 0.0
-    user_type_preference: float = 0.0
-    days_since_update: int = 365
-    updated_this_week: float = 0.0
-    type_matches_context: float = 0.0
-    type_task: float = 0.0
-    type_project: float = 0.0
-    type_grant: float = 0.0
-    type_publication: float = 0.0
-    type_navigation: float = 0.0
-
-
-@dataclass
-class RankingWeights:
-    """Weights for the linear ranking model."""
-    title_exact_match: float = 5.0
-    title_token_overlap: float = 3.0
-    char_ngram_similarity: float = 1.5
-    user_previously_selected: float = 2.0
-    user_type_preference: float = 1.0
-    updated_this_week: float = 0.5
-    type_matches_context: float = 1.5
-    title_length: float = -0.01
-    days_since_update: float = -0.005
-
-
-class SearchRanker:
-    """Simplified search ranker for testing."""
-
-    def __init__(self, weights: Optional[RankingWeights] = None):
-        self.weights = weights or RankingWeights()
-
-    def compute_token_overlap(self, s1: str, s2: str) -> float:
-        """Compute Jaccard similarity on word tokens."""
-        tokens1 = set(s1.lower().split())
-        tokens2 = set(s2.lower().split())
-        if not tokens1 or not tokens2:
-            return 0.0
-        intersection = len(tokens1 & tokens2)
-        union = len(tokens1 | tokens2)
-        return intersection / union if union > 0 else 0.0
-
-    def compute_ngram_similarity(self, s1: str, s2: str, n: int = 3) -> float:
-        """Compute character n-gram Jaccard similarity."""
-        def get_ngrams(s: str) -> Set[str]:
-            s = s.lower()
-            return {s[i:i+n] for i in range(max(0, len(s) - n + 1))}
-        ngrams1 = get_ngrams(s1)
-        ngrams2 = get_ngrams(s2)
-        if not ngrams1 or not ngrams2:
-            return 0.0
-        intersection = len(ngrams1 & ngrams2)
-        union = len(ngrams1 | ngrams2)
-        return intersection / union if union > 0 else 0.0
-
-    def score(self, features: SearchRankingFeatures) -> float:
-        """Compute ranking score from features."""
-        score = 0.0
-        score += features.title_exact_match * self.weights.title_exact_match
-        score += features.title_token_overlap * self.weights.title_token_overlap
-        score += features.char_ngram_similarity * self.weights.char_ngram_similarity
-        score += features.user_previously_selected * self.weights.user_previously_selected
-        score += features.user_type_preference * self.weights.user_type_preference
-        score += features.updated_this_week * self.weights.updated_this_week
-        score += features.days_since_update * self.weights.days_since_update
-        score += features.type_matches_context * self.weights.type_matches_context
-        score += features.title_length * self.weights.title_length
-        return score
-
-
-class SearchRankingMetrics:
-    """Evaluation metrics for search ranking quality."""
-
-    @staticmethod
-    def mean_reciprocal_rank(rankings: List[int]) -> float:
-        """Calculate MRR from a list of positions."""
-        if not rankings:
-            return 0.0
-        reciprocal_ranks = [1.0 / r for r in rankings if r > 0]
-        return sum(reciprocal_ranks) / len(reciprocal_ranks) if reciprocal_ranks else 0.0
-
-    @staticmethod
-    def precision_at_k(relevant: Set[str], retrieved: List[str], k: int) -> float:
-        """Calculate precision@k."""
-        if k <= 0:
-            return 0.0
-        retrieved_k = retrieved[:k]
-        relevant_retrieved = len(set(retrieved_k) & relevant)
-        return relevant_retrieved / k
-
-    @staticmethod
-    def dcg_at_k(relevance_scores: List[float], k: int) -> float:
-        """Calculate Discounted Cumulative Gain at k."""
-        dcg = 0.0
-        for i, rel in enumerate(relevance_scores[:k]):
-            dcg += (2 ** rel - 1) / math.log2(i + 2)
-        return dcg
-
-    @staticmethod
-    def ndcg_at_k(relevance_scores: List[float], k: int) -> float:
-        """Calculate Normalized DCG at k."""
-        dcg = SearchRankingMetrics.dcg_at_k(relevance_scores, k)
-        ideal_scores = sorted(relevance_scores, reverse=True)
-        idcg = SearchRankingMetrics.dcg_at_k(ideal_scores, k)
-        return dcg / idcg if idcg > 0 else 0.0
-
-    @staticmethod
-    def click_through_rate(clicks: int, impressions: int) -> float:
-        """Calculate Click-Through Rate."""
-        return clicks / impressions if impressions > 0 else 0.0
-
-
-class OnboardingPredictor:
-    """Simplified onboarding predictor for testing."""
-
-    # Feature weights (trained coefficients)
-    WEIGHTS = {
-        "started_onboarding": 0.3,
-        "has_full_name": 0.15,
-        "has_institution": 0.15,
-        "profile_completeness_score": 0.1,
-        "minutes_to_first_action": -0.005,
-        "max_step_reached_day_1": 0.12,
-        "signup_hour_business": 0.05,
-        "is_invited_user": 0.1,
-    }
-
-    # Intercept (base probability)
-    INTERCEPT = 0.2
-
-    def predict(self, features: Dict[str, Any]) -> Dict[str, Any]:
-        """Predict onboarding completion probability."""
-        # Calculate linear combination
-        score = self.INTERCEPT
-
-        if features.get("started_onboarding", False):
-            score += self.WEIGHTS["started_onboarding"]
-        if features.get("has_full_name", False):
-            score += self.WEIGHTS["has_full_name"]
-        if features.get("has_institution", False):
-            score += self.WEIGHTS["has_institution"]
-
-        profile_score = features.get("profile_completeness_score", 0)
-        score += profile_score * self.WEIGHTS["profile_completeness_score"]
-
-        minutes = features.get("minutes_to_first_action", 60)
-        score += min(minutes, 120) * self.WEIGHTS["minutes_to_first_action"]
-
-        max_step = features.get("max_step_reached_day_1", 0)
-        score += max_step * self.WEIGHTS["max_step_reached_day_1"]
-
-        signup_hour = features.get("signup_hour", 12)
-        if 9 <= signup_hour <= 17:
-            score += self.WEIGHTS["signup_hour_business"]
-
-        if features.get("is_invited_user", False):
-            score += self.WEIGHTS["is_invited_user"]
-
-        # Sigmoid transformation
-        probability = 1 / (1 + math.exp(-score * 3))
-
-        # Determine risk category
-        if probability >= 0.7:
-            risk_category = "low_risk"
-        elif probability >= 0.4:
-            risk_category = "medium_risk"
-        else:
-            risk_category = "high_risk"
-
-        # Identify risk factors
-        risk_factors = []
-        if not features.get("started_onboarding", False):
-            risk_factors.append("has_not_started_onboarding")
-        if features.get("minutes_to_first_action", 60) > 60:
-            risk_factors.append("slow_first_action")
-        if features.get("max_step_reached_day_1", 0) < 2:
-            risk_factors.append("low_engagement_day_1")
-        if not features.get("has_full_name", False):
-            risk_factors.append("incomplete_profile")
-
-        return {
-            "completion_probability": round(probability, 3),
-            "risk_category": risk_category,
-            "risk_factors": risk_factors[:3],
-        }
+
+import numpy as np
+from scipy import special
+
+from app.ml.models.onboarding_predictor import (
+    ModelConfig,
+    OnboardingCompletionPredictor,
+    _cached_rule_score,
+)
+from app.ml.models.search_ranker import (
+    SearchContext,
+    SearchRanker,
+    SearchRankingFeatures,
+    SearchRankingMetrics,
+    SearchResult,
+)
 
 
 # =============================================================================
@@ -222,28 +36,28 @@ class TestSearchRankerTokenOverlap:
 
     def test_identical_strings(self):
         ranker = SearchRanker()
-        assert ranker.compute_token_overlap("hello world", "hello world") == 1.0
+        assert ranker._compute_token_overlap("hello world", "hello world") == 1.0
 
     def test_no_overlap(self):
         ranker = SearchRanker()
-        assert ranker.compute_token_overlap("foo bar", "baz qux") == 0.0
+        assert ranker._compute_token_overlap("foo bar", "baz qux") == 0.0
 
     def test_partial_overlap(self):
         ranker = SearchRanker()
-        overlap = ranker.compute_token_overlap("project deadline", "deadline report")
+        overlap = ranker._compute_token_overlap("project deadline", "deadline report")
         assert 0 < overlap < 1
         # "deadline" is shared, so intersection=1, union=3
         assert abs(overlap - 1/3) < 0.01
 
     def test_case_insensitive(self):
         ranker = SearchRanker()
-        assert ranker.compute_token_overlap("Hello World", "hello world") == 1.0
+        assert ranker._compute_token_overlap("Hello World", "hello world") == 1.0
 
     def test_empty_strings(self):
         ranker = SearchRanker()
-        assert ranker.compute_token_overlap("", "") == 0.0
-        assert ranker.compute_token_overlap("hello", "") == 0.0
-        assert ranker.compute_token_overlap("", "world") == 0.0
+        assert ranker._compute_token_overlap("", "") == 0.0
+        assert ranker._compute_token_overlap("hello", "") == 0.0
+        assert ranker._compute_token_overlap("", "world") == 0.0
 
 
 class TestSearchRankerNgramSimilarity:
@@ -251,25 +65,25 @@ class TestSearchRankerNgramSimilarity:
 
     def test_identical_strings(self):
         ranker = SearchRanker()
-        assert ranker.compute_ngram_similarity("hello", "hello") == 1.0
+        assert ranker._compute_ngram_similarity("hello", "hello") == 1.0
 
     def test_no_similarity(self):
         ranker = SearchRanker()
-        assert ranker.compute_ngram_similarity("abc", "xyz") == 0.0
+        assert ranker._compute_ngram_similarity("abc", "xyz") == 0.0
 
     def test_partial_similarity(self):
         ranker = SearchRanker()
-        sim = ranker.compute_ngram_similarity("project", "projects")
+        sim = ranker._compute_ngram_similarity("project", "projects")
         assert 0.5 < sim < 1.0  # Most n-grams overlap
 
     def test_short_strings(self):
         ranker = SearchRanker()
         # Strings shorter than n-gram size
-        assert ranker.compute_ngram_similarity("ab", "ab") == 0.0
+        assert ranker._compute_ngram_similarity("ab", "ab") == 0.0
 
     def test_case_insensitive(self):
         ranker = SearchRanker()
-        assert ranker.compute_ngram_similarity("Hello", "hello") == 1.0
+        assert ranker._compute_ngram_similarity("Hello", "hello") == 1.0
 
 
 class TestSearchRankerScoring:
@@ -309,6 +123,64 @@ class TestSearchRankerScoring:
         assert ranker.score(short) > ranker.score(long)
 
 
+class TestSearchRankerTopK:
+    """Tests for ranking only the top k results."""
+
+    CONTEXT = SearchContext(user_id="user-1", workspace_id=None, query="grant")
+
+    def _results(self):
+        titles = [
+            "grant report", "other", "grant", "notes", "grant proposal draft",
+            "other", "grant", "misc", "grant budget", "other",
+        ]
+        return [
+            SearchResult(id=f"r{i}", title=title, result_type="task", updated_days_ago=3)
+            for i, title in enumerate(titles)
+        ]
+
+    def _ids(self, results):
+        return [result.id for result in results]
+
+    def test_matches_full_ranking_prefix(self):
+        ranker = SearchRanker()
+        full = self._ids(ranker.rank(self._results(), "grant", [], self.CONTEXT))
+
+        for k in range(1, 11):
+            top = ranker.rank(self._results(), "grant", [], self.CONTEXT, top_k=k)
+            assert self._ids(top) == full[:k]
+
+    def test_ties_keep_input_order(self):
+        ranker = SearchRanker()
+        top = ranker.rank(self._results(), "grant", [], self.CONTEXT, top_k=2)
+
+        # "grant" appears twice with identical scores
+        assert self._ids(top) == ["r2", "r6"]
+
+    def test_k_larger_than_results(self):
+        ranker = SearchRanker()
+        top = ranker.rank(self._results(), "grant", [], self.CONTEXT, top_k=50)
+
+        assert len(top) == 10
+
+    def test_scores_every_result(self):
+        ranker = SearchRanker()
+        results = self._results()
+        ranker.rank(results, "grant", [], self.CONTEXT, top_k=1)
+
+        assert all(result.features is not None for result in results)
+
+    def test_empty_results(self):
+        ranker = SearchRanker()
+
+        assert ranker.rank([], "grant", [], self.CONTEXT, top_k=3) == []
+
+    def test_invalid_k(self):
+        ranker = SearchRanker()
+
+        with pytest.raises(ValueError):
+            ranker.rank(self._results(), "grant", [], self.CONTEXT, top_k=0)
+
+
 class TestSearchRankingMetrics:
     """Tests for ranking evaluation metrics."""
 
@@ -366,7 +238,7 @@ class TestOnboardingPredictor:
     """Tests for onboarding completion prediction."""
 
     def test_high_engagement_user(self):
-        predictor = OnboardingPredictor()
+        predictor = OnboardingCompletionPredictor()
         result = predictor.predict({
             "started_onboarding": True,
             "has_full_name": True,
@@ -378,12 +250,12 @@ class TestOnboardingPredictor:
             "is_invited_user": True,
         })
 
-        assert result["completion_probability"] > 0.7
-        assert result["risk_category"] == "low_risk"
-        assert len(result["risk_factors"]) == 0
+        assert result.completion_probability > 0.7
+        assert result.risk_category == "low_risk"
+        assert len(result.top_risk_factors) == 0
 
     def test_low_engagement_user(self):
-        predictor = OnboardingPredictor()
+        predictor = OnboardingCompletionPredictor()
         result = predictor.predict({
             "started_onboarding": False,
             "has_full_name": False,
@@ -395,12 +267,12 @@ class TestOnboardingPredictor:
             "is_invited_user": False,
         })
 
-        assert result["completion_probability"] < 0.5
-        assert result["risk_category"] == "high_risk"
-        assert "has_not_started_onboarding" in result["risk_factors"]
+        assert result.completion_probability < 0.5
+        assert result.risk_category == "high_risk"
+        assert "Has not started onboarding" in result.top_risk_factors
 
     def test_medium_engagement_user(self):
-        predictor = OnboardingPredictor()
+        predictor = OnboardingCompletionPredictor()
         result = predictor.predict({
             "started_onboarding": True,
             "has_full_name": False,
@@ -413,11 +285,11 @@ class TestOnboardingPredictor:
         })
 
         # Should be somewhere in the middle range
-        assert 0.3 < result["completion_probability"] < 0.85
-        assert result["risk_category"] in ["medium_risk", "low_risk"]
+        assert 0.3 < result.completion_probability < 0.85
+        assert result.risk_category in ["medium_risk", "low_risk"]
 
     def test_risk_factors_identified(self):
-        predictor = OnboardingPredictor()
+        predictor = OnboardingCompletionPredictor()
         result = predictor.predict({
             "started_onboarding": False,
             "has_full_name": False,
@@ -426,11 +298,11 @@ class TestOnboardingPredictor:
         })
 
         # Should identify multiple risk factors
-        assert "has_not_started_onboarding" in result["risk_factors"]
-        assert "slow_first_action" in result["risk_factors"]
+        assert "Has not started onboarding" in result.top_risk_factors
+        assert "Slow to take first action (>1 hour)" in result.top_risk_factors
 
     def test_probability_bounds(self):
-        predictor = OnboardingPredictor()
+        predictor = OnboardingCompletionPredictor()
 
         # Test extreme positive case
         result_high = predictor.predict({
@@ -443,7 +315,7 @@ class TestOnboardingPredictor:
             "signup_hour": 10,
             "is_invited_user": True,
         })
-        assert 0 < result_high["completion_probability"] <= 1
+        assert 0 < result_high.completion_probability <= 1
 
         # Test extreme negative case
         result_low = predictor.predict({
@@ -456,14 +328,14 @@ class TestOnboardingPredictor:
             "signup_hour": 3,
             "is_invited_user": False,
         })
-        assert 0 <= result_low["completion_probability"] < 1
+        assert 0 <= result_low.completion_probability < 1
 
 
 class TestOnboardingRiskCategories:
     """Tests for risk category assignment."""
 
     def test_low_risk_threshold(self):
-        predictor = OnboardingPredictor()
+        predictor = OnboardingCompletionPredictor()
         # This should produce probability > 0.7
         result = predictor.predict({
             "started_onboarding": True,
@@ -475,42 +347,211 @@ class TestOnboardingRiskCategories:
             "signup_hour": 10,
             "is_invited_user": True,
         })
-        assert result["risk_category"] == "low_risk"
+        assert result.risk_category == "low_risk"
 
     def test_high_risk_threshold(self):
-        predictor = OnboardingPredictor()
-        # This should produce probability < 0.4
+        predictor = OnboardingCompletionPredictor()
+        # This should produce probability < 0.3
         result = predictor.predict({
             "started_onboarding": False,
             "profile_completeness_score": 0,
             "minutes_to_first_action": 120,
             "max_step_reached_day_1": 0,
         })
-        assert result["risk_category"] == "high_risk"
+        assert result.risk_category == "high_risk"
+
+
+class TestOnboardingRuleBasedCache:
+    """Tests for memoized rule-based scoring."""
+
+    def test_matches_batch_scores(self):
+        predictor = OnboardingCompletionPredictor()
+        users = [
+            {
+                "started_onboarding": started,
+                "max_step_reached_day_1": step,
+                "has_full_name": True,
+                "minutes_to_first_action": minutes,
+                "is_invited_user": step % 2 == 0,
+            }
+            for started in (True, False)
+            for step in (0, 2, 5)
+            for minutes in (0, 4.9, 5, 30, 60, 60.1, 600)
+        ]
+
+        single = [predictor.predict_rule_based(user) for user in users]
+        batch = predictor.predict_proba_batch(users)
+
+        np.testing.assert_allclose(single, batch)
+
+    def test_repeated_users_hit_cache(self):
+        predictor = OnboardingCompletionPredictor()
+        user = {"started_onboarding": True, "max_step_reached_day_1": 3}
+        _cached_rule_score.cache_clear()
+
+        first = predictor.predict_rule_based(user)
+        second = predictor.predict_rule_based(dict(user, minutes_to_first_action=30))
+
+        assert first == second
+        assert _cached_rule_score.cache_info().hits == 1
+
+    def test_defaults(self):
+        predictor = OnboardingCompletionPredictor()
+
+        assert predictor.predict_rule_based({}) == pytest.approx(0.3)
+
+
+class TestOnboardingFeatureImportance:
+    """Tests for feature importance rankings."""
+
+    def test_sorted_by_importance(self):
+        importance = OnboardingCompletionPredictor().get_feature_importance()
+
+        values = [entry["importance"] for entry in importance]
+        assert values == sorted(values, reverse=True)
+        assert importance[0] == {
+            "feature": "started_onboarding",
+            "importance": 0.3,
+            "direction": "positive",
+        }
+        assert {entry["feature"]: entry["direction"] for entry in importance}[
+            "minutes_to_first_action"
+        ] == "negative"
+
+    def test_returns_copies(self):
+        predictor = OnboardingCompletionPredictor()
+        predictor.get_feature_importance()[0]["importance"] = 99.0
+
+        assert predictor.get_feature_importance()[0]["importance"] == 0.3
+
+
+def _training_users(n, seed=0):
+    """Synthetic users whose completion follows onboarding progress."""
+    rng = np.random.default_rng(seed)
+    users = []
+    for i in range(n):
+        step = int(rng.integers(0, 6))
+        started = bool(step > 0 or rng.random() < 0.2)
+        users.append({
+            "user_id": f"user-{i}",
+            "started_onboarding": started,
+            "has_full_name": bool(rng.random() < 0.6),
+            "has_institution": bool(rng.random() < 0.4),
+            "profile_completeness_score": int(rng.integers(0, 5)),
+            "minutes_to_first_action": float(rng.exponential(30)),
+            "max_step_reached_day_1": step,
+            "signup_hour": int(rng.integers(0, 24)),
+            "signup_day_of_week": int(rng.integers(0, 7)),
+            "is_invited_user": bool(rng.random() < 0.3),
+            "completed": bool(rng.random() < 0.1 + 0.16 * step),
+        })
+    return users
+
+
+class TestOnboardingPredictorTraining:
+    """Tests for the logistic model fitted by train()."""
+
+    def _trained(self, n=300):
+        predictor = OnboardingCompletionPredictor(ModelConfig(min_training_samples=100))
+        metrics = predictor.train(_training_users(n))
+        return predictor, metrics
+
+    def test_insufficient_samples(self):
+        predictor = OnboardingCompletionPredictor()
+        metrics = predictor.train(_training_users(10))
+
+        assert metrics["success"] is False
+        assert predictor.model is None
+
+    def test_untrained_batch_matches_rule_based(self):
+        predictor = OnboardingCompletionPredictor()
+        users = _training_users(20)
+
+        batch = predictor.predict_proba_batch(users)
+        expected = [predictor.predict_rule_based(user) for user in users]
+
+        np.testing.assert_allclose(batch, expected)
+
+    def test_train_reports_metrics(self):
+        predictor, metrics = self._trained()
+
+        assert metrics["success"] is True
+        assert metrics["model_type"] == "logistic"
+        assert metrics["n_samples"] == 300
+        assert 0.5 < metrics["train_accuracy"] <= 1.0
+
+    def test_batch_matches_scaled_model(self):
+        predictor, _ = self._trained()
+        users = _training_users(25, seed=1)
+
+        mean, std = predictor.scaler
+        expected = [
+            special.expit(
+                predictor.model[0]
+                + ((predictor.prepare_features(user) - mean) / std) @ predictor.model[1:]
+            )
+            for user in users
+        ]
+
+        np.testing.assert_allclose(predictor.predict_proba_batch(users), expected)
+
+    def test_trained_model_learns_progress(self):
+        predictor, _ = self._trained(n=1000)
+        low, high = predictor.predict_proba_batch([
+            {"started_onboarding": True, "max_step_reached_day_1": 0},
+            {"started_onboarding": True, "max_step_reached_day_1": 5},
+        ])
+
+        assert high > low
+
+    def test_predict_uses_trained_model(self):
+        predictor, _ = self._trained()
+        user = _training_users(1, seed=2)[0]
+
+        result = predictor.predict(user)
+
+        assert result.completion_probability == pytest.approx(
+            predictor.predict_proba_batch([user])[0]
+        )
+
+    def test_constant_feature(self):
+        predictor = OnboardingCompletionPredictor(ModelConfig(min_training_samples=100))
+        users = _training_users(200)
+        for user in users:
+            user["signup_hour"] = 9
+
+        assert predictor.train(users)["success"] is True
+        assert np.isfinite(predictor.model).all()
+
+    def test_empty_batch(self):
+        predictor, _ = self._trained()
+
+        assert predictor.predict_proba_batch([]).shape == (0,)
+        assert predictor.predict_batch([]) == []
 
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
     def test_empty_features(self):
-        predictor = OnboardingPredictor()
+        predictor = OnboardingCompletionPredictor()
         result = predictor.predict({})
-        assert "completion_probability" in result
-        assert "risk_category" in result
-        assert 0 <= result["completion_probability"] <= 1
+        assert result.user_id == "unknown"
+        assert result.risk_category in ["high_risk", "medium_risk", "low_risk"]
+        assert 0 <= result.completion_probability <= 1
 
     def test_unicode_handling_in_ranker(self):
         ranker = SearchRanker()
         # Should not raise exceptions with unicode
-        overlap = ranker.compute_token_overlap("项目", "项目计划")
+        overlap = ranker._compute_token_overlap("项目", "项目计划")
         assert isinstance(overlap, float)
 
-        ngram = ranker.compute_ngram_similarity("文档", "文档管理")
+        ngram = ranker._compute_ngram_similarity("文档", "文档管理")
         assert isinstance(ngram, float)
 
     def test_special_characters_in_ranker(self):
         ranker = SearchRanker()
-        overlap = ranker.compute_token_overlap("test@#$%", "test@#$%")
+        overlap = ranker._compute_token_overlap("test@#$%", "test@#$%")
         assert overlap == 1.0
 
     def test_very_long_strings(self):
@@ -519,5 +560,5 @@ class TestEdgeCases:
         long_str2 = "word " * 500 + "other " * 500
 
         # Should complete without error
-        overlap = ranker.compute_token_overlap(long_str1, long_str2)
+        overlap = ranker._compute_token_overlap(long_str1, long_str2)
         assert isinstance(overlap, float)